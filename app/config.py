@@ -2,72 +2,143 @@
 Configuration management for PII scanner.
 """
 
-import json
+import atexit
+import functools
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
+from . import fastjson
+from .constants import (
+    CONFIG_FILENAME,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_EXTENSIONS,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_OVERLAP,
+    DEFAULT_POLL_SECONDS,
+    MAX_RECENT_DIRS,
+)
+
+
+@dataclass(slots=True)
+class MutableUserPrefs:
+    """User-adjustable settings, written back to disk on process exit."""
+
+    default_output_dir: str = DEFAULT_OUTPUT_DIR
+    default_extensions: list[str] = field(
+        default_factory=lambda: list(DEFAULT_EXTENSIONS)
+    )
+    default_chunk_size: int = DEFAULT_CHUNK_SIZE
+    default_overlap: int = DEFAULT_OVERLAP
+    default_poll_seconds: int = DEFAULT_POLL_SECONDS
+    recent_output_dirs: list[str] = field(default_factory=list)
+    max_recent_dirs: int = MAX_RECENT_DIRS
+
+    # Unrecognized keys from the config file, preserved on save
+    extra: dict[str, Any] = field(default_factory=dict)
+    dirty: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MutableUserPrefs":
+        """Build preferences from a loaded config dict."""
+        known = {k: v for k, v in data.items() if k in _PREF_KEYS}
+        extra = {k: v for k, v in data.items() if k not in _PREF_KEYS}
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten preferences back into the on-disk config layout."""
+        data = {key: getattr(self, key) for key in _PREF_KEYS}
+        data.update(self.extra)
+        return data
 
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a preference value."""
+        if key in _PREF_KEYS:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+
+    def set(self, key: str, value: Any):
+        """Set a preference value and mark the preferences for saving."""
+        if key in _PREF_KEYS:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+        self.dirty = True
+
+
+_PREF_KEYS = frozenset(
+    f.name for f in fields(MutableUserPrefs) if f.name not in ("extra", "dirty")
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration manager for PII scanner."""
 
-    def __init__(self, config_file: Path = None):
+    config_file: Path
+    prefs: MutableUserPrefs
+
+    @classmethod
+    def load(cls, config_file: Path = None) -> "Config":
         """
-        Initialize configuration.
+        Load configuration.
 
         Args:
             config_file: Path to config file (default: ~/.pii_scanner_config.json)
+
+        Returns:
+            Config whose preferences are saved at exit if they were changed
         """
         if config_file is None:
-            config_file = Path.home() / ".pii_scanner_config.json"
-
-        self.config_file = config_file
-        self.config = self._load_config()
-
-    def _load_config(self) -> dict[str, Any]:
-        """Load configuration from file."""
-        default_config = {
-            "default_output_dir": "./pii_results",
-            "default_extensions": [".txt", ".csv", ".log", ".md", ".html", ".pdf"],
-            "default_chunk_size": 2000,
-            "default_overlap": 100,
-            "default_poll_seconds": 10,
-            "recent_output_dirs": [],
-            "max_recent_dirs": 10,
-        }
+            config_file = Path.home() / CONFIG_FILENAME
+
+        # Only user overrides live on disk; without them the defaults are
+        # used as-is and no JSON is parsed
+        user_config = {}
+        try:
+            with open(config_file, "rb") as f:
+                user_config = fastjson.loads(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Could not load config file: {e}")
 
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, encoding="utf-8") as f:
-                    user_config = json.load(f)
-                    # Merge with defaults
-                    default_config.update(user_config)
-            except Exception as e:
-                print(f"Warning: Could not load config file: {e}")
+        config = cls(config_file, MutableUserPrefs.from_dict(user_config))
+        atexit.register(config.flush)
+        return config
 
-        return default_config
+    @property
+    def config(self) -> dict[str, Any]:
+        """Configuration as a plain dict."""
+        return self.prefs.to_dict()
 
     def _save_config(self):
         """Save configuration to file."""
         try:
             # Ensure directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2)
+            with open(self.config_file, "wb") as f:
+                f.write(fastjson.dumps(self.prefs.to_dict()))
+            self.prefs.dirty = False
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
 
+    def flush(self):
+        """Save pending preference changes."""
+        if self.prefs.dirty:
+            self._save_config()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
-        return self.config.get(key, default)
+        return self.prefs.get(key, default)
 
     def set(self, key: str, value: Any):
         """Set configuration value."""
-        self.config[key] = value
-        self._save_config()
+        self.prefs.set(key, value)
 
     def add_recent_output_dir(self, output_dir: str):
         """Add output directory to recent list."""
-        recent_dirs = self.config.get("recent_output_dirs", [])
+        recent_dirs = list(self.prefs.recent_output_dirs)
 
         # Remove if already exists
         if output_dir in recent_dirs:
@@ -77,29 +148,25 @@ class Config:
         recent_dirs.insert(0, output_dir)
 
         # Limit size
-        max_dirs = self.config.get("max_recent_dirs", 10)
-        recent_dirs = recent_dirs[:max_dirs]
+        recent_dirs = recent_dirs[: self.prefs.max_recent_dirs]
 
-        self.config["recent_output_dirs"] = recent_dirs
-        self._save_config()
+        self.set("recent_output_dirs", recent_dirs)
 
     def get_recent_output_dirs(self) -> list:
-        """Get list of recent output directories."""
-        return self.config.get("recent_output_dirs", [])
+        """Get list of recent output directories (a copy; use the setters)."""
+        return list(self.prefs.recent_output_dirs)
 
     def get_default_output_dir(self) -> str:
         """Get default output directory."""
-        return self.config.get("default_output_dir", "./pii_results")
+        return self.prefs.default_output_dir
 
     def set_default_output_dir(self, output_dir: str):
         """Set default output directory."""
         self.set("default_output_dir", output_dir)
 
     def get_default_extensions(self) -> list:
-        """Get default file extensions."""
-        return self.config.get(
-            "default_extensions", [".txt", ".csv", ".log", ".md", ".html", ".pdf"]
-        )
+        """Get default file extensions (a copy; use the setters)."""
+        return list(self.prefs.default_extensions)
 
     def set_default_extensions(self, extensions: list):
         """Set default file extensions."""
@@ -108,8 +175,8 @@ class Config:
     def get_default_chunk_settings(self) -> dict[str, int]:
         """Get default chunk settings."""
         return {
-            "chunk_size": self.config.get("default_chunk_size", 2000),
-            "overlap": self.config.get("default_overlap", 100),
+            "chunk_size": self.prefs.default_chunk_size,
+            "overlap": self.prefs.default_overlap,
         }
 
     def set_default_chunk_settings(self, chunk_size: int, overlap: int):
@@ -119,28 +186,24 @@ class Config:
 
     def get_default_poll_seconds(self) -> int:
         """Get default polling interval."""
-        return self.config.get("default_poll_seconds", 10)
+        return self.prefs.default_poll_seconds
 
     def set_default_poll_seconds(self, poll_seconds: int):
         """Set default polling interval."""
         self.set("default_poll_seconds", poll_seconds)
 
 
-# Global config instance
-_config = None
-
-
+@functools.cache
 def get_config() -> Config:
     """Get global configuration instance."""
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config.load()
 
 
 def reset_config():
     """Reset configuration to defaults."""
-    global _config
-    if _config and _config.config_file.exists():
-        _config.config_file.unlink()
-    _config = None
+    # A config already loaded must not write its changes back at exit;
+    # otherwise there is nothing to load just to delete the file
+    if get_config.cache_info().currsize:
+        atexit.unregister(get_config().flush)
+    (Path.home() / CONFIG_FILENAME).unlink(missing_ok=True)
+    get_config.cache_clear()
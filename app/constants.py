@@ -0,0 +1,12 @@
+"""
+Static defaults for the PII scanner user configuration.
+"""
+
+DEFAULT_OUTPUT_DIR = "./pii_results"
+DEFAULT_EXTENSIONS = (".txt", ".csv", ".log", ".md", ".html", ".pdf")
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_OVERLAP = 100
+DEFAULT_POLL_SECONDS = 10
+MAX_RECENT_DIRS = 10
+
+CONFIG_FILENAME = ".pii_scanner_config.json"
@@ -2,11 +2,59 @@
 Deduplication functionality with canonical keys and persistence.
 """
 
+import atexit
+import functools
 import hashlib
-import json
+import mmap
 import os
+import struct
+import sys
 from pathlib import Path
 
+from . import fastjson
+
+# Add parent directory to path for config import
+sys.path.append(str(Path(__file__).parent.parent))
+from config import HASH16_ALGORITHM
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Journal layout: 8-byte magic header followed by fixed-size records of
+# (st_dev, st_ino, size, mtime_ns).  Later records win on load.
+JOURNAL_MAGIC = b"GGSEEN\x00\x03"
+RECORD = struct.Struct("<QQQq")
+
+# Journals written while records carried a path hash; converted on load
+_JOURNAL_MAGIC_V4 = b"GGSEEN\x00\x04"
+_RECORD_V4 = struct.Struct("<QQQqQ")
+
+# Rewrite the journal once it grows past this size and is mostly stale records
+JOURNAL_COMPACT_BYTES = 16 * 1024 * 1024
+
+
+def _hash16(data: bytes) -> str:
+    """16 hex character id for a canonical key."""
+    if HASH16_ALGORITHM != "md5":
+        if xxhash is not None:
+            return xxhash.xxh3_128(data).hexdigest()[:16]
+        if blake3 is not None:
+            return blake3.blake3(data, max_threads=1).hexdigest(length=8)
+    return hashlib.md5(data).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve(path_str: str) -> str:
+    """Resolve symlinks, memoized for files queried repeatedly in one scan."""
+    return os.path.realpath(path_str)
+
 
 class DedupeManager:
     """Manages deduplication using canonical keys and persistent storage."""
@@ -19,36 +67,143 @@ class DedupeManager:
             out_dir: Output directory for persistence files
         """
         self.out_dir = out_dir
+        self.journal_path = out_dir / ".seen.log"
+
+        # Legacy JSON persistence, imported once if no journal exists yet
         self.summary_index_path = out_dir / ".summary_index.json"
-        self.seen_path = out_dir / ".seen.json"
 
-        # Load existing data
-        self.summary_index = self._load_json(self.summary_index_path, {})
-        self.seen = self._load_json(self.seen_path, {})
+        # Ensure directory exists
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # Load existing data: (st_dev, st_ino) -> (size, mtime_ns)
+        self.processed = self._load_journal()
+        if not self.processed and not self.journal_path.exists():
+            self.processed = self._load_legacy_index()
+            if self.processed:
+                self._compact()
+
+        # The journal is opened on the first add_processed(), so managers only
+        # used for lookups hold no file descriptor or exit hook
+        self._fd = -1
+
+    def _open_journal(self):
+        """Open the journal for appending, writing the header if it is new."""
+        self._fd = os.open(
+            self.journal_path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+            0o644,
+        )
+        self._journal_bytes = os.fstat(self._fd).st_size
+        if self._journal_bytes == 0:
+            os.write(self._fd, JOURNAL_MAGIC)
+            self._journal_bytes = len(JOURNAL_MAGIC)
+
+    def _ensure_journal(self):
+        """Open the journal if it is closed, arming the exit hook that closes it."""
+        if self._fd < 0:
+            self._open_journal()
+            atexit.register(self.close)
 
     def _load_json(self, path: Path, default: dict) -> dict:
         """Load JSON file with error handling."""
         try:
             if path.exists():
-                with open(path, encoding="utf-8") as f:
-                    return json.load(f)
+                with open(path, "rb") as f:
+                    return fastjson.loads(f.read())
         except Exception as e:
             print(f"Warning: Could not load {path}: {e}", file=os.sys.stderr)
         return default
 
-    def _save_json(self, path: Path, data: dict):
-        """Save JSON file with error handling."""
+    def _load_legacy_index(self) -> dict[tuple[int, int], tuple[int, int]]:
+        """Convert a legacy .summary_index.json into journal entries."""
+        processed = {}
+        for canonical_key in self._load_json(self.summary_index_path, {}):
+            try:
+                path_str, size, mtime_ns = canonical_key.rsplit("|", 2)
+                st = os.stat(path_str)
+            except (OSError, ValueError):
+                continue
+
+            # Only carry over files that are still unchanged
+            if self._signature_from(st) == (int(size), int(mtime_ns)):
+                identity = self._file_identity(path_str, st)
+                processed[identity] = self._signature_from(st)
+        return processed
+
+    def _load_journal(self) -> dict[tuple[int, int], tuple[int, int]]:
+        """Load the append-only journal by mapping it into memory."""
+        processed = {}
+        header = len(JOURNAL_MAGIC)
+
         try:
-            # Ensure directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            size = self.journal_path.stat().st_size
+        except FileNotFoundError:
+            return processed
+
+        try:
+            if size <= header:
+                return processed
+
+            with (
+                open(self.journal_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                magic = mm[:header]
+                if magic == JOURNAL_MAGIC:
+                    record = RECORD
+                elif magic == _JOURNAL_MAGIC_V4:
+                    record = _RECORD_V4
+                else:
+                    print(
+                        "Warning: Ignoring unrecognized journal "
+                        f"{self.journal_path}",
+                        file=os.sys.stderr,
+                    )
+                    self.journal_path.unlink()
+                    return processed
+
+                # Drop a torn trailing record left by an interrupted write
+                end = size - (size - header) % record.size
+                with memoryview(mm)[header:end] as view:
+                    records = record.iter_unpack(view)
+                    for dev, ino, file_size, mtime_ns, *_ in records:
+                        processed[dev, ino] = (file_size, mtime_ns)
+
+            if record is _RECORD_V4:
+                # Rewrite in the current layout and drop the filter file that
+                # accompanied it
+                self.processed = processed
+                self._compact()
+                (self.out_dir / ".seen.bloom").unlink(missing_ok=True)
+            elif end != size:
+                os.truncate(self.journal_path, end)
+
         except Exception as e:
-            print(f"Warning: Could not save {path}: {e}", file=os.sys.stderr)
+            print(
+                f"Warning: Could not load {self.journal_path}: {e}", file=os.sys.stderr
+            )
+        return processed
+
+    def _compact(self):
+        """Rewrite the journal with one record per file."""
+        temp_path = self.journal_path.with_suffix(".tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(JOURNAL_MAGIC)
+                f.writelines(
+                    RECORD.pack(dev, ino, *entry)
+                    for (dev, ino), entry in self.processed.items()
+                )
+            temp_path.replace(self.journal_path)
+        except OSError as e:
+            print(
+                f"Warning: Could not compact {self.journal_path}: {e}",
+                file=os.sys.stderr,
+            )
 
     def _get_canonical_key(self, file_path: Path) -> str:
         """
-        Generate canonical key for file: realpath|size|mtime_ns.
+        Generate canonical key for file: dev:ino|size|mtime_ns.
 
         Args:
             file_path: Path to the file
@@ -57,21 +212,7 @@ class DedupeManager:
             Canonical key string
         """
         try:
-            # Get real path (resolve symlinks)
-            real_path = file_path.resolve()
-
-            # Normalize path format (lowercase on Windows, POSIX format)
-            if os.name == "nt":  # Windows
-                path_str = str(real_path).lower()
-            else:  # POSIX
-                path_str = str(real_path)
-
-            # Get file stats
-            stat = real_path.stat()
-            size = stat.st_size
-            mtime_ns = stat.st_mtime_ns
-
-            return f"{path_str}|{size}|{mtime_ns}"
+            return self._canonical_key_from(file_path, os.stat(file_path))
 
         except Exception as e:
             print(
@@ -80,54 +221,104 @@ class DedupeManager:
             )
             return ""
 
-    def _get_file_signature(self, file_path: Path) -> str:
-        """
-        Get file signature: "size:mtime".
-
-        Args:
-            file_path: Path to the file
+    @staticmethod
+    def _normalize_path(real_path: str) -> str:
+        """Normalize path format (lowercase on Windows, POSIX format)."""
+        if os.name == "nt":  # Windows
+            return real_path.lower()
+        return real_path
 
-        Returns:
-            File signature string
+    def _file_identity(
+        self, file_path: Path | str, st: os.stat_result
+    ) -> tuple[int, int]:
         """
-        try:
-            stat = file_path.stat()
-            return f"{stat.st_size}:{stat.st_mtime}"
-        except Exception as e:
-            print(
-                f"Warning: Could not get signature for {file_path}: {e}",
-                file=os.sys.stderr,
-            )
-            return ""
+        Stable identity of a file.
 
-    def is_duplicate(self, file_path: Path) -> bool:
+        Device and inode numbers come straight from the stat result, so the
+        identity survives renames, hard links and symlinked paths. Only
+        filesystems that do not report an inode fall back to a hash of the
+        real path, stored under device 0; that identity survives symlinks
+        but not renames.
+        """
+        if st.st_ino:
+            return (st.st_dev, st.st_ino)
+        path_str = self._normalize_path(_resolve(os.fspath(file_path)))
+        digest = hashlib.md5(path_str.encode("utf-8")).digest()
+        return (0, int.from_bytes(digest[:8], "little"))
+
+    def _canonical_key_from(
+        self,
+        file_path: Path | str,
+        st: os.stat_result,
+        identity: tuple[int, int] | None = None,
+    ) -> str:
+        """Build the canonical key from an already taken stat (and identity)."""
+        dev, ino = identity or self._file_identity(file_path, st)
+        return f"{dev}:{ino}|{st.st_size}|{st.st_mtime_ns}"
+
+    @staticmethod
+    def _signature_from(st: os.stat_result) -> tuple[int, int]:
+        """Change signature of a file: (size, mtime_ns)."""
+        return (st.st_size, st.st_mtime_ns)
+
+    def is_duplicate(self, file_path: Path, st: os.stat_result | None = None) -> bool:
         """
-        Check if file is a duplicate (already processed).
+        Check if file is a duplicate (already processed and unchanged).
 
         Args:
             file_path: Path to the file
+            st: Stat result of the file, if the caller already has one
 
         Returns:
             True if file is a duplicate
         """
-        canonical_key = self._get_canonical_key(file_path)
-        if not canonical_key:
-            return False
-
-        # Check if canonical key exists in summary index
-        if canonical_key in self.summary_index:
-            return True
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError as e:
+                print(
+                    f"Warning: Could not get canonical key for {file_path}: {e}",
+                    file=os.sys.stderr,
+                )
+                return False
+
+        seen = self.processed.get(self._file_identity(file_path, st))
+        return seen == self._signature_from(st)
+
+    def check_and_get(
+        self, file_path: Path, st: os.stat_result | None = None
+    ) -> tuple[bool, str | None]:
+        """
+        Check if file is a duplicate and, if it is not, get its hash16.
 
-        # Check if file is unchanged (same signature)
-        file_signature = self._get_file_signature(file_path)
-        if not file_signature:
-            return False
+        Equivalent to is_duplicate() followed by get_hash16(), but the stat
+        and file identity are taken once and shared by both.
 
-        real_path = str(file_path.resolve())
-        if real_path in self.seen and self.seen[real_path] == file_signature:
-            return True
+        Args:
+            file_path: Path to the file
+            st: Stat result of the file, if the caller already has one
 
-        return False
+        Returns:
+            (is_duplicate, hash16), with hash16 None for duplicates
+        """
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError as e:
+                print(
+                    f"Warning: Could not get canonical key for {file_path}: {e}",
+                    file=os.sys.stderr,
+                )
+                return False, "0000000000000000"
+
+        identity = self._file_identity(file_path, st)
+        if self.processed.get(identity) == self._signature_from(st):
+            return True, None
+
+        if HASH16_ALGORITHM == "md5":
+            return False, self.get_hash16(file_path, st)
+        canonical_key = self._canonical_key_from(file_path, st, identity)
+        return False, _hash16(canonical_key.encode("utf-8"))
 
     def add_processed(self, file_path: Path, canonical_key: str):
         """
@@ -140,37 +331,71 @@ class DedupeManager:
         if not canonical_key:
             return
 
-        # Add to summary index
-        self.summary_index[canonical_key] = True
+        identity, size, mtime_ns = canonical_key.split("|")
+        dev, ino = identity.split(":")
+        key = (int(dev), int(ino))
+        entry = (int(size), int(mtime_ns))
+        self.processed[key] = entry
 
-        # Add to seen with signature
-        file_signature = self._get_file_signature(file_path)
-        if file_signature:
-            real_path = str(file_path.resolve())
-            self.seen[real_path] = file_signature
+        # Persist with a single fixed-size append
+        try:
+            self._ensure_journal()
+            os.write(self._fd, RECORD.pack(*key, *entry))
+            self._journal_bytes += RECORD.size
+        except OSError as e:
+            print(
+                f"Warning: Could not save {self.journal_path}: {e}", file=os.sys.stderr
+            )
+            return
 
-        # Persist changes
-        self._save_json(self.summary_index_path, self.summary_index)
-        self._save_json(self.seen_path, self.seen)
+        live_bytes = len(self.processed) * RECORD.size
+        if (
+            self._journal_bytes > JOURNAL_COMPACT_BYTES
+            and self._journal_bytes > 2 * live_bytes
+        ):
+            os.close(self._fd)
+            self._compact()
+            self._open_journal()
+
+    def close(self):
+        """Close the persistence journal.
+
+        The manager stays usable; the journal is reopened when next written.
+        """
+        if self._fd >= 0:
+            atexit.unregister(self.close)
+            os.close(self._fd)
+            self._fd = -1
 
-    def get_hash16(self, file_path: Path) -> str:
+    def get_hash16(self, file_path: Path, st: os.stat_result | None = None) -> str:
         """
         Generate 16-character hash for file.
 
         Args:
             file_path: Path to the file
+            st: Stat result of the file, if the caller already has one
 
         Returns:
             16-character hash string
         """
         try:
-            canonical_key = self._get_canonical_key(file_path)
+            if HASH16_ALGORITHM == "md5":
+                # Older versions hashed realpath|size|mtime_ns
+                real_path = _resolve(os.fspath(file_path))
+                if st is None:
+                    st = os.stat(real_path)
+                canonical_key = (
+                    f"{self._normalize_path(real_path)}|{st.st_size}|{st.st_mtime_ns}"
+                )
+            elif st is not None:
+                canonical_key = self._canonical_key_from(file_path, st)
+            else:
+                canonical_key = self._get_canonical_key(file_path)
             if not canonical_key:
                 return "0000000000000000"
 
             # Generate hash from canonical key
-            hash_obj = hashlib.md5(canonical_key.encode("utf-8"))
-            return hash_obj.hexdigest()[:16]
+            return _hash16(canonical_key.encode("utf-8"))
 
         except Exception as e:
             print(
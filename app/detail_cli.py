@@ -4,48 +4,156 @@ Detail CLI for viewing specific PII entities found in files.
 
 import argparse
 import csv
-import json
+import io
+import mmap
+import multiprocessing
+import operator
+import os
 import sys
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import pairwise
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+from . import fastjson
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# summary.csv columns, read as text so ids like hash16 keep leading zeros
+_SUMMARY_COLUMNS = (
+    "file",
+    "hash16",
+    "size_bytes",
+    "modified",
+    "controlled",
+    "noncontrolled",
+    "total",
+    "top_types",
+    "scan_started",
+    "scan_ended",
+)
+
+# Entity files larger than this are decoded across a process pool
+PARALLEL_LOAD_BYTES = 32 << 20
+
+_entity_fields = operator.itemgetter(
+    "entity_type",
+    "value",
+    "label",
+    "score",
+    "start",
+    "end",
+    "context_left",
+    "context_right",
+)
+
+# Fallbacks for fields missing from an entity record
+_DISPLAY_DEFAULTS = {
+    "entity_type": "UNKNOWN",
+    "value": "N/A",
+    "label": "N/A",
+    "score": 0,
+    "start": 0,
+    "end": 0,
+    "context_left": "",
+    "context_right": "",
+}
+_CSV_DEFAULTS = {
+    "entity_type": "",
+    "value": "",
+    "label": "",
+    "score": 0,
+    "start": 0,
+    "end": 0,
+    "context_left": "",
+    "context_right": "",
+}
+
+
+def iter_entities(entities_path: Path) -> Iterator[dict[str, Any]]:
+    """Stream entities from a JSONL file one record at a time."""
+    if not entities_path.exists() or entities_path.stat().st_size == 0:
+        return
+    with (
+        open(entities_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for line in iter(mm.readline, b""):
+            if line.strip():
+                yield fastjson.loads(line)
+
+
+def _decode_range(args: tuple[str, int, int]) -> list[dict[str, Any]]:
+    """Decode the JSONL lines between two byte offsets (pool worker)."""
+    path, start, end = args
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        return [
+            fastjson.loads(line) for line in mm[start:end].split(b"\n") if line.strip()
+        ]
 
 
 def load_entities_file(entities_path: Path) -> list[dict[str, Any]]:
     """Load entities from JSONL file."""
+    if (
+        not entities_path.exists()
+        or entities_path.stat().st_size <= PARALLEL_LOAD_BYTES
+    ):
+        return list(iter_entities(entities_path))
+
+    # Split huge files at line boundaries and decode the pieces in parallel
+    workers = os.cpu_count() or 1
+    with (
+        open(entities_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        size = len(mm)
+        bounds = [0]
+        for i in range(1, workers):
+            pos = mm.find(b"\n", max(size * i // workers, bounds[-1]))
+            if pos == -1:
+                break
+            bounds.append(pos + 1)
+        bounds.append(size)
+
+    ranges = [(str(entities_path), a, b) for a, b in pairwise(bounds) if a < b]
     entities = []
-    if entities_path.exists():
-        with open(entities_path, encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    entities.append(json.loads(line))
+    with multiprocessing.Pool(min(workers, len(ranges))) as pool:
+        for chunk in pool.imap(_decode_range, ranges):
+            entities.extend(chunk)
     return entities
 
 
-def format_entity(entity: dict[str, Any]) -> str:
-    """Format a single entity for display."""
-    lines = []
-    lines.append(f"  🔍 Entity Type: {entity.get('entity_type', 'UNKNOWN')}")
-    lines.append(f"  📝 Value: {entity.get('value', 'N/A')}")
-    lines.append(f"  🏷️  Label: {entity.get('label', 'N/A')}")
-    lines.append(f"  📊 Score: {entity.get('score', 0):.2f}")
-    lines.append(f"  📍 Position: {entity.get('start', 0)}-{entity.get('end', 0)}")
+def format_entity(entity: dict[str, Any], buf: TextIO):
+    """Format a single entity for display, writing it to ``buf``."""
+    etype, value, label, score, start, end, context_left, context_right = (
+        _entity_fields({**_DISPLAY_DEFAULTS, **entity})
+    )
+    buf.write(f"  🔍 Entity Type: {etype}\n")
+    buf.write(f"  📝 Value: {value}\n")
+    buf.write(f"  🏷️  Label: {label}\n")
+    buf.write(f"  📊 Score: {score:.2f}\n")
+    buf.write(f"  📍 Position: {start}-{end}\n")
 
-    context_left = entity.get("context_left", "")
-    context_right = entity.get("context_right", "")
     if context_left or context_right:
-        lines.append(
-            f"  📄 Context: ...{context_left} [{entity.get('value', '')}] {context_right}..."
+        buf.write(
+            f"  📄 Context: ...{context_left} [{entity.get('value', '')}] {context_right}...\n"
         )
 
-    return "\n".join(lines)
-
 
 def export_entities_to_csv(
     entities: list[dict[str, Any]], output_path: Path, filename: str
 ):
     """Export entities to CSV format."""
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
 
         # Headers
@@ -63,20 +171,72 @@ def export_entities_to_csv(
         writer.writerow(headers)
 
         # Data rows
-        for entity in entities:
-            writer.writerow(
-                [
-                    filename,
-                    entity.get("entity_type", ""),
-                    entity.get("value", ""),
-                    entity.get("label", ""),
-                    f"{entity.get('score', 0):.2f}",
-                    entity.get("start", 0),
-                    entity.get("end", 0),
-                    entity.get("context_left", ""),
-                    entity.get("context_right", ""),
-                ]
+        writer.writerows(
+            (filename, etype, value, label, f"{score:.2f}", start, end, left, right)
+            for etype, value, label, score, start, end, left, right in map(
+                _entity_fields, ({**_CSV_DEFAULTS, **e} for e in entities)
             )
+        )
+
+
+def _find_summary_row(
+    csv_file: Path, filename: str
+) -> tuple[dict[str, Any] | None, list[str]]:
+    """
+    Find the summary row for a file.
+
+    Rows match on path suffix, or on the stem so "report" finds "report.pdf".
+    Returns the matching row (or None) and, on a miss, every file path seen.
+    """
+    if not csv_file.exists():
+        return None, []
+
+    target_name = filename
+    target_stem = Path(filename).stem
+
+    if pacsv is not None:
+        try:
+            table = pacsv.read_csv(
+                csv_file,
+                convert_options=pacsv.ConvertOptions(
+                    column_types=dict.fromkeys(_SUMMARY_COLUMNS, pa.string())
+                ),
+            )
+        except pa.ArrowInvalid:
+            # Ragged or malformed rows; the csv module below is more lenient
+            table = None
+
+        if table is not None and "file" in table.column_names:
+            files = table.column("file")
+            mask = pc.or_(
+                pc.ends_with(files, target_name),
+                pc.match_substring(files, target_stem),
+            )
+            for idx in pc.indices_nonzero(mask).to_pylist():
+                file_path = files[idx].as_py()
+                if (
+                    file_path.endswith(target_name)
+                    or Path(file_path).stem == target_stem
+                ):
+                    return table.slice(idx, 1).to_pylist()[0], []
+            return None, files.fill_null("").to_pylist()
+
+    available = []
+    with open(csv_file, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        fi = header.index("file") if "file" in header else None
+        for row in reader:
+            file_path = row[fi] if fi is not None and fi < len(row) else ""
+
+            # The substring test keeps Path construction off the miss path
+            if file_path.endswith(target_name) or (
+                target_stem in file_path and Path(file_path).stem == target_stem
+            ):
+                return dict(zip(header, row)), []
+
+            available.append(file_path)
+    return None, available
 
 
 def show_file_details(out_dir: Path, filename: str):
@@ -89,39 +249,14 @@ def show_file_details(out_dir: Path, filename: str):
 
     # First, try to find the file in the CSV summary
     csv_file = out_dir / "summary.csv"
-    target_file_path = None
-    file_info = None
-
-
-    if csv_file.exists():
-        import csv
-
-        with open(csv_file, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                file_path = row.get("file", "")
-
-                # Try multiple matching strategies
-                match1 = file_path.endswith(filename)
-                match2 = Path(file_path).name == filename
-                match3 = filename in file_path
-                match4 = Path(file_path).stem == Path(filename).stem
-
-
-                if match1 or match2 or match3 or match4:
-                    target_file_path = file_path
-                    file_info = row
-                    break
+    file_info, available = _find_summary_row(csv_file, filename)
+    target_file_path = file_info.get("file") if file_info else None
 
     if not target_file_path:
         print(f"❌ File '{filename}' not found in scan results.")
         print("Available files:")
-        if csv_file.exists():
-            with open(csv_file, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    file_path = row.get("file", "")
-                    print(f"  - {Path(file_path).name} (from {file_path})")
+        for file_path in available:
+            print(f"  - {Path(file_path).name} (from {file_path})")
         sys.exit(1)
 
     # Find the corresponding entities file using hash16
@@ -135,9 +270,6 @@ def show_file_details(out_dir: Path, filename: str):
         print(f"❌ No entities file found for: {filename}")
         sys.exit(1)
 
-    # Load entities for this specific file
-    all_entities = load_entities_file(entities_path)
-
     # Display file info
     print(f"📁 File: {target_file_path}")
     print(
@@ -150,27 +282,32 @@ def show_file_details(out_dir: Path, filename: str):
     print(f"🔍 PII Entities Found in '{Path(target_file_path).name}':")
     print("=" * 60)
 
-    if not all_entities:
-        print("✅ No PII entities found in this file.")
-        return
-
-    # Group entities by type
+    # Stream entities for this specific file straight into their groups
     by_type = {}
-    for entity in all_entities:
+    total = 0
+    for entity in iter_entities(entities_path):
         entity_type = entity.get("entity_type", "UNKNOWN")
         if entity_type not in by_type:
             by_type[entity_type] = []
         by_type[entity_type].append(entity)
+        total += 1
+
+    if not total:
+        print("✅ No PII entities found in this file.")
+        return
 
-    # Display entities grouped by type
+    # Display entities grouped by type, buffered into a single write
+    buf = io.StringIO()
     for entity_type, entities in sorted(by_type.items()):
-        print(f"\n📋 {entity_type} ({len(entities)} found):")
-        print("-" * 40)
+        buf.write(f"\n📋 {entity_type} ({len(entities)} found):\n")
+        buf.write("-" * 40 + "\n")
 
         for i, entity in enumerate(entities, 1):
-            print(f"\n{i}. {format_entity(entity)}")
+            buf.write(f"\n{i}. ")
+            format_entity(entity, buf)
 
-    print(f"\n📊 Total: {len(all_entities)} entities found")
+    buf.write(f"\n📊 Total: {total} entities found\n")
+    sys.stdout.write(buf.getvalue())
 
 
 def main():
@@ -205,18 +342,15 @@ Examples:
         file_info = None
 
         if csv_file.exists():
-            import csv
-
-            with open(csv_file, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
+            with open(csv_file, encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                fi = header.index("file") if "file" in header else None
                 for row in reader:
-                    file_path = row.get("file", "")
-                    if (
-                        file_path.endswith(args.file)
-                        or Path(file_path).name == args.file
-                    ):
+                    file_path = row[fi] if fi is not None and fi < len(row) else ""
+                    if file_path.endswith(args.file):
                         target_file_path = file_path
-                        file_info = row
+                        file_info = dict(zip(header, row))
                         break
 
         if not target_file_path:
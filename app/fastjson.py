@@ -0,0 +1,89 @@
+"""
+JSON encoding helpers backed by orjson when it is available.
+"""
+
+import dataclasses
+import json
+import os
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# Human-readable output for inspecting files by hand
+PRETTY = bool(os.environ.get("GG_PRETTY"))
+
+
+def _default(obj: Any) -> Any:
+    """Encode dataclasses for the stdlib fallback, as orjson does natively."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Compact encoder reused by dumps_lines when orjson is unavailable
+_LINE_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=_default
+)
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: Encoded JSON as bytes or str
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool | None = None) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize; dataclass instances become JSON objects
+        indent: Pretty-print with two-space indentation (default: only when
+            the GG_PRETTY environment variable is set)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if indent is None:
+        indent = PRETTY
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode(
+            "utf-8"
+        )
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_default
+    ).encode("utf-8")
+
+
+def dumps_lines(objs: Iterable[Any]) -> bytes:
+    """
+    Serialize objects to a single JSON Lines buffer.
+
+    Encodes a whole batch in one call so callers can write it with a single
+    write instead of encoding and writing object by object.
+
+    Args:
+        objs: Objects to serialize, one per line
+
+    Returns:
+        Encoded JSON Lines bytes, each line terminated by a newline
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        return b"".join([orjson.dumps(obj, option=option) for obj in objs])
+    return "".join([_LINE_ENCODER.encode(obj) + "\n" for obj in objs]).encode("utf-8")
@@ -3,19 +3,37 @@ Universal large file scanner with intelligent processing for ANY file type.
 Handles CSV, TXT, PDF, JSON, XML, logs, and more with automatic optimization.
 """
 
-import gc
 import mmap
+import multiprocessing as mp
+import os
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-from app.parallel_scanner import MemoryManager, _process_text_chunk
-from app.progress import ProgressMonitor, ProgressTracker
+import psutil
+
+from app.parallel_scanner import MemoryManager, _init_worker, _process_text_chunk
+from app.progress import BatchedProgress, ProgressMonitor, ProgressTracker
 from ingest.csv_stream import StreamingCSVProcessor
 from ingest.dispatch import extract_text_stream
+from ingest.text_stream import LINE_ALIGN_WINDOW, iter_byte_chunks
 from pii.engine import hits_from_text
 
+# (chunk_size, overlap) passed to hits_from_text. Strategies whose chunks are
+# already cut on row/line boundaries use larger windows with less overlap.
+DEFAULT_SUBCHUNK = (4000, 200)
+STRATEGY_SUBCHUNK = {
+    "csv_streaming": (8000, 100),
+    "memory_mapped": (8000, 100),
+}
+
+# Most chunks handed to a worker as one pool task
+MAP_BATCH_CHUNKS = 16
+
 
 class UniversalLargeFileScanner:
     """
@@ -23,6 +41,9 @@ class UniversalLargeFileScanner:
     Intelligently handles text files, CSVs, PDFs, logs, JSON, XML, etc.
     """
 
+    # Physical RAM in MB, read once per process
+    _total_memory_mb: float | None = None
+
     def __init__(
         self, max_workers: int | None = None, max_memory_mb: int | None = None
     ):
@@ -37,17 +58,51 @@ class UniversalLargeFileScanner:
         self.max_workers = max_workers or self.memory_manager.get_optimal_workers()
         # Auto-calculate memory limit (80% of available RAM)
         if max_memory_mb is None:
-            import psutil
-
-            total_mb = psutil.virtual_memory().total / (1024 * 1024)
-            self.max_memory_mb = int(total_mb * 0.8)
+            cls = type(self)
+            if cls._total_memory_mb is None:
+                cls._total_memory_mb = psutil.virtual_memory().total / (1024 * 1024)
+            self.max_memory_mb = int(cls._total_memory_mb * 0.8)
         else:
             self.max_memory_mb = max_memory_mb
 
+        # Worker pool shared by every scan strategy, created on first use
+        self._pool: ProcessPoolExecutor | None = None
+
         print(
             f"🚀 Universal Scanner initialized: {self.max_workers} workers, {self.max_memory_mb}MB memory limit"
         )
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the persistent worker pool, starting it on first use."""
+        if self._pool is None:
+            # forkserver avoids forking a possibly large parent process
+            methods = mp.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else None
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp.get_context(method),
+                initializer=_init_worker,
+            )
+        return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """Shut down a broken worker pool so the next use starts a fresh one."""
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
     def scan_file(self, file_path: Path, out_dir: Path) -> dict[str, Any]:
         """
         Intelligently scan ANY large file with automatic optimization.
@@ -135,23 +190,14 @@ class UniversalLargeFileScanner:
                 if b"\x00" in sample:
                     is_binary = True
                 else:
-                    # Decode and analyze text
-                    try:
-                        text_sample = sample.decode("utf-8", errors="ignore")
-                        sample_lines = text_sample.count("\n")
-
-                        # Check for structured data
-                        if (
-                            file_ext == ".csv"
-                            or "," in text_sample[:1000]
-                            and sample_lines > 5
-                        ):
-                            is_structured = True
-                        elif file_ext in [".json", ".xml"]:
-                            is_structured = True
-
-                    except (UnicodeDecodeError, AttributeError):
-                        is_binary = True
+                    # Analyze the raw bytes; no decode needed to count lines
+                    sample_lines = sample.count(b"\n")
+
+                    # Check for structured data
+                    if file_ext == ".csv" or b"," in sample[:1000] and sample_lines > 5:
+                        is_structured = True
+                    elif file_ext in [".json", ".xml"]:
+                        is_structured = True
             except (OSError, IOError):
                 is_binary = True
 
@@ -182,6 +228,7 @@ class UniversalLargeFileScanner:
                 "estimated_chunks": estimated_chunks,
                 "strategy": strategy,
                 "optimal_chunk_size": chunk_size,
+                "subchunk": STRATEGY_SUBCHUNK.get(strategy, DEFAULT_SUBCHUNK),
                 "sample_lines": sample_lines,
             }
 
@@ -190,6 +237,7 @@ class UniversalLargeFileScanner:
                 "error": str(e),
                 "file_path": str(file_path),
                 "strategy": "standard",
+                "subchunk": DEFAULT_SUBCHUNK,
             }
 
     def _choose_strategy(
@@ -240,29 +288,28 @@ class UniversalLargeFileScanner:
 
         all_entities = []
         csv_processor = StreamingCSVProcessor(file_path, self.max_memory_mb // 2)
-
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-
-            for text_chunk in csv_processor.stream_concatenated_text(
-                chunk_rows=2000, max_chars=file_info["optimal_chunk_size"]
+        progress = BatchedProgress(tracker)
+        subchunk, overlap = file_info.get("subchunk", DEFAULT_SUBCHUNK)
+
+        def jobs():
+            for text_chunk, byte_count in csv_processor.stream_concatenated_text(
+                chunk_rows=2000,
+                max_chars=file_info["optimal_chunk_size"],
+                with_sizes=True,
             ):
-                if text_chunk.strip():
-                    future = executor.submit(_process_text_chunk, text_chunk, 4000, 200)
-                    futures.append(future)
-
+                if text_chunk and not text_chunk.isspace():
                     # Update progress
-                    rows_processed, total_rows, _ = csv_processor.get_progress()
-                    tracker.update(
-                        processed=1, bytes_count=len(text_chunk.encode("utf-8"))
-                    )
-
-                    # Collect results periodically
-                    if len(futures) >= self.max_workers * 2:
-                        self._collect_futures(futures, all_entities, tracker)
-
-            # Collect remaining results
-            self._collect_futures(futures, all_entities, tracker)
+                    progress.update(processed=1, bytes_count=byte_count)
+                    yield (text_chunk, subchunk, overlap)
+
+        with progress:
+            self._map_chunks(
+                self._get_pool(),
+                jobs(),
+                all_entities,
+                progress,
+                file_info["size_bytes"] // file_info["optimal_chunk_size"],
+            )
 
         return self._build_result(all_entities, tracker, file_info)
 
@@ -274,51 +321,76 @@ class UniversalLargeFileScanner:
 
         all_entities = []
         chunk_size = file_info["optimal_chunk_size"]
+        subchunk, overlap = file_info.get("subchunk", DEFAULT_SUBCHUNK)
+        progress = BatchedProgress(tracker)
 
         try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mmapped_file:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mmapped_file:
 
-                    with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                        futures = []
+                    file_len = len(mmapped_file)
+                    if hasattr(mmapped_file, "madvise"):
+                        mmapped_file.madvise(mmap.MADV_SEQUENTIAL)
+
+                    def jobs():
                         position = 0
+                        while position < file_len:
+                            # End the chunk on a line boundary so entities and
+                            # multi-byte characters are never split
+                            end_pos = min(position + chunk_size, file_len)
+                            newline = mmapped_file.find(
+                                b"\n", end_pos, end_pos + LINE_ALIGN_WINDOW
+                            )
+                            if newline != -1:
+                                end_pos = newline + 1
+
+                            # Prefetch the next chunk while this one is scanned
+                            if hasattr(mmapped_file, "madvise") and end_pos < file_len:
+                                page_start = end_pos - end_pos % mmap.PAGESIZE
+                                mmapped_file.madvise(
+                                    mmap.MADV_WILLNEED,
+                                    page_start,
+                                    min(chunk_size, file_len - page_start),
+                                )
 
-                        while position < len(mmapped_file):
-                            # Read chunk
-                            end_pos = min(position + chunk_size, len(mmapped_file))
+                            # Workers decode the raw bytes themselves
                             chunk_bytes = mmapped_file[position:end_pos]
-
-                            try:
-                                text_chunk = chunk_bytes.decode(
-                                    "utf-8", errors="ignore"
+                            if chunk_bytes and not chunk_bytes.isspace():
+                                progress.update(
+                                    processed=1, bytes_count=len(chunk_bytes)
                                 )
-
-                                if text_chunk.strip():
-                                    future = executor.submit(
-                                        _process_text_chunk, text_chunk, 4000, 200
+                                yield (chunk_bytes, subchunk, overlap)
+
+                            # The chunk was copied out; let the kernel drop
+                            # its pages without waiting on memory pressure
+                            if hasattr(mmap, "MADV_DONTNEED"):
+                                page_start = position - position % mmap.PAGESIZE
+                                page_end = end_pos - end_pos % mmap.PAGESIZE
+                                if page_end > page_start:
+                                    mmapped_file.madvise(
+                                        mmap.MADV_DONTNEED,
+                                        page_start,
+                                        page_end - page_start,
                                     )
-                                    futures.append(future)
 
-                                    tracker.update(
-                                        processed=1, bytes_count=len(chunk_bytes)
-                                    )
+                            position = end_pos
 
-                                    # Collect results periodically
-                                    if len(futures) >= self.max_workers * 2:
-                                        self._collect_futures(
-                                            futures, all_entities, tracker
-                                        )
-
-                                position = end_pos
-
-                            except UnicodeDecodeError:
-                                position += 1000  # Skip problematic section
-
-                        # Collect remaining results
-                        self._collect_futures(futures, all_entities, tracker)
+                    with progress:
+                        self._map_chunks(
+                            self._get_pool(),
+                            jobs(),
+                            all_entities,
+                            progress,
+                            file_len // chunk_size,
+                        )
+            finally:
+                os.close(fd)
 
         except Exception as e:
             print(f"Memory mapping failed, falling back: {e}")
+            # The fallback rescans from the start; drop the partial counts
+            tracker.reset_counters()
             return self._scan_chunked_streaming(file_path, tracker, file_info)
 
         return self._build_result(all_entities, tracker, file_info)
@@ -331,29 +403,31 @@ class UniversalLargeFileScanner:
 
         all_entities = []
         chunk_size = file_info["optimal_chunk_size"]
+        subchunk, overlap = file_info.get("subchunk", DEFAULT_SUBCHUNK)
 
         try:
-            # Use existing text extraction
-            for text_chunk in extract_text_stream(file_path, chunk_size):
-                if text_chunk.strip():
-                    entities = hits_from_text(text_chunk, 4000, 200)
-                    all_entities.extend(entities)
-
-                    # Update progress
-                    controlled = sum(1 for e in entities if e.label == "Controlled")
-                    noncontrolled = len(entities) - controlled
-
-                    tracker.update(
-                        processed=1,
-                        entities=len(entities),
-                        controlled=controlled,
-                        noncontrolled=noncontrolled,
-                        bytes_count=len(text_chunk.encode("utf-8")),
-                    )
+            with BatchedProgress(tracker) as progress:
+                # Use existing text extraction
+                for text_chunk in extract_text_stream(file_path, chunk_size):
+                    if text_chunk and not text_chunk.isspace():
+                        entities = hits_from_text(text_chunk, subchunk, overlap)
+                        all_entities.extend(entities)
+
+                        # Update progress
+                        controlled = sum(1 for e in entities if e.label == "Controlled")
+                        noncontrolled = len(entities) - controlled
+
+                        progress.update(
+                            processed=1,
+                            entities=len(entities),
+                            controlled=controlled,
+                            noncontrolled=noncontrolled,
+                            bytes_count=len(text_chunk),
+                        )
 
-                    # Memory cleanup
-                    if tracker.processed_items % 10 == 0:
-                        self.memory_manager.cleanup_if_needed()
+                        # Memory cleanup
+                        if progress.calls & 0x3F == 0:
+                            self.memory_manager.cleanup_if_needed()
 
         except Exception as e:
             print(f"Chunked streaming error: {e}")
@@ -368,31 +442,34 @@ class UniversalLargeFileScanner:
 
         all_entities = []
         chunk_size = file_info["optimal_chunk_size"]
+        subchunk, overlap = file_info.get("subchunk", DEFAULT_SUBCHUNK)
+        progress = BatchedProgress(tracker)
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-
-            try:
+        def jobs():
+            if file_info.get("type") == ".pdf":
                 for text_chunk in extract_text_stream(file_path, chunk_size):
-                    if text_chunk.strip():
-                        future = executor.submit(
-                            _process_text_chunk, text_chunk, 4000, 200
-                        )
-                        futures.append(future)
+                    if text_chunk and not text_chunk.isspace():
+                        progress.update(processed=1, bytes_count=len(text_chunk))
+                        yield (text_chunk, subchunk, overlap)
+                return
 
-                        tracker.update(
-                            processed=1, bytes_count=len(text_chunk.encode("utf-8"))
-                        )
+            # Plain text: ship raw bytes and let the workers decode them
+            for chunk_bytes in iter_byte_chunks(file_path, chunk_size):
+                progress.update(processed=1, bytes_count=len(chunk_bytes))
+                yield (chunk_bytes, subchunk, overlap)
 
-                        # Collect results periodically
-                        if len(futures) >= self.max_workers * 3:
-                            self._collect_futures(futures, all_entities, tracker)
-
-                # Collect remaining results
-                self._collect_futures(futures, all_entities, tracker)
+        try:
+            with progress:
+                self._map_chunks(
+                    self._get_pool(),
+                    jobs(),
+                    all_entities,
+                    progress,
+                    file_info["size_bytes"] // chunk_size,
+                )
 
-            except Exception as e:
-                print(f"Parallel processing error: {e}")
+        except Exception as e:
+            print(f"Parallel processing error: {e}")
 
         return self._build_result(all_entities, tracker, file_info)
 
@@ -404,14 +481,16 @@ class UniversalLargeFileScanner:
 
         try:
             # Extract all text at once for smaller files
-            all_text = ""
-            for text_chunk in extract_text_stream(
-                file_path, file_info.get("optimal_chunk_size", 10000)
-            ):
-                all_text += text_chunk + "\n"
+            parts = list(
+                extract_text_stream(
+                    file_path, file_info.get("optimal_chunk_size", 10000)
+                )
+            )
+            all_text = "\n".join(parts)
 
             # Process all at once
-            entities = hits_from_text(all_text, 4000, 200)
+            subchunk, overlap = file_info.get("subchunk", DEFAULT_SUBCHUNK)
+            entities = hits_from_text(all_text, subchunk, overlap)
 
             # Update tracker
             controlled = sum(1 for e in entities if e.label == "Controlled")
@@ -422,7 +501,7 @@ class UniversalLargeFileScanner:
                 entities=len(entities),
                 controlled=controlled,
                 noncontrolled=noncontrolled,
-                bytes_count=len(all_text.encode("utf-8")),
+                bytes_count=sum(map(len, parts)),
             )
 
             return self._build_result(entities, tracker, file_info)
@@ -431,41 +510,54 @@ class UniversalLargeFileScanner:
             print(f"Standard processing error: {e}")
             return self._build_result([], tracker, file_info)
 
-    def _collect_futures(
-        self, futures: list, all_entities: list, tracker: ProgressTracker
+    def _map_chunks(
+        self,
+        executor: ProcessPoolExecutor,
+        jobs: Iterator[tuple[str | bytes, int, int]],
+        all_entities: list,
+        progress: BatchedProgress,
+        total_chunks: int,
     ):
-        """Collect results from completed futures."""
-        completed = []
+        """
+        Run chunk jobs through the pool with batched task submission.
+
+        Jobs are grouped into batches of at most ``MAP_BATCH_CHUNKS`` chunks,
+        each submitted as a single task so pickling and IPC are amortized.
+        A rolling window of ``2 * max_workers`` batches stays in flight, so a
+        huge file is never queued in full and workers never idle waiting for
+        the slowest batch of a window. Results are consumed in order.
+        If a worker dies the pool is discarded, so later scans start a fresh
+        one, and the error is re-raised.
+        """
+        chunksize = max(
+            1, min(MAP_BATCH_CHUNKS, total_chunks // (self.max_workers * 8))
+        )
+        in_flight: deque[Future] = deque()
 
-        for future in as_completed(futures, timeout=0.1):
-            try:
-                entities = future.result()
+        def consume(future: Future):
+            for entities in future.result():
                 all_entities.extend(entities)
 
                 # Update tracker
                 controlled = sum(1 for e in entities if e.label == "Controlled")
                 noncontrolled = len(entities) - controlled
 
-                tracker.update(
+                progress.update(
                     entities=len(entities),
                     controlled=controlled,
                     noncontrolled=noncontrolled,
                 )
 
-                completed.append(future)
-
-            except Exception as e:
-                print(f"Warning: Chunk failed: {e}")
-                completed.append(future)
-
-        # Remove completed futures
-        for future in completed:
-            if future in futures:
-                futures.remove(future)
-
-        # Memory cleanup
-        if len(completed) > 0:
-            gc.collect()
+        try:
+            while batch := list(islice(jobs, chunksize)):
+                if len(in_flight) >= self.max_workers * 2:
+                    consume(in_flight.popleft())
+                in_flight.append(executor.submit(_process_chunk_batch, batch))
+            while in_flight:
+                consume(in_flight.popleft())
+        except BrokenExecutor:
+            self._discard_pool(executor)
+            raise
 
     def _build_result(
         self, entities: list, tracker: ProgressTracker, file_info: dict
@@ -473,16 +565,24 @@ class UniversalLargeFileScanner:
         """Build final result dictionary."""
         stats = tracker.get_stats()
 
+        # One pass over the entities; the remainder is noncontrolled
+        controlled = sum(1 for e in entities if e.label == "Controlled")
+
         return {
             "entities": entities,
             "stats": stats,
             "file_info": file_info,
             "summary": {
                 "total_entities": len(entities),
-                "controlled": sum(1 for e in entities if e.label == "Controlled"),
-                "noncontrolled": sum(1 for e in entities if e.label != "Controlled"),
+                "controlled": controlled,
+                "noncontrolled": len(entities) - controlled,
                 "processing_time": stats["elapsed_seconds"],
                 "throughput_mb_per_sec": file_info.get("size_mb", 0)
                 / max(stats["elapsed_seconds"], 0.1),
             },
         }
+
+
+def _process_chunk_batch(batch: list[tuple[str | bytes, int, int]]) -> list[list]:
+    """Run a batch of ``(text, chunk_size, overlap)`` jobs in one pool task."""
+    return [_process_text_chunk(*job) for job in batch]
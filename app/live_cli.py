@@ -4,12 +4,21 @@ Live status CLI - auto-refreshing view of PII detection results
 """
 
 import argparse
+import ast
 import csv
+import heapq
+import json
 import sys
 import time
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+# Entity types that drive the severity column
+CRITICAL_TYPES = frozenset({"ID", "CREDIT_CARD", "BANK_ROUTING", "DRIVER_LICENSE"})
+MEDIUM_TYPES = frozenset({"PHONE_NUMBER", "EIN", "ZIP", "ADDRESS"})
+
 
 def clear_screen():
     """Clear the terminal screen using ANSI escape codes."""
@@ -18,7 +27,7 @@ def clear_screen():
 
 def parse_top_types(top_types_str: str) -> dict[str, int]:
     """
-    Parse top_types string like "{'ID': 2, 'EMAIL_ADDRESS': 1}" into dict.
+    Parse top_types string like '{"ID": 2, "EMAIL_ADDRESS": 1}' into dict.
 
     Args:
         top_types_str: String representation of top_types
@@ -29,32 +38,16 @@ def parse_top_types(top_types_str: str) -> dict[str, int]:
     if not top_types_str or top_types_str == "{}":
         return {}
 
-    # Handle the actual CSV format which uses Python dict syntax
+    # The CSV stores top_types as JSON; older summaries hold the dict's
+    # Python repr, which parses as a literal
     try:
-        # Remove outer braces and quotes, replace single quotes with double quotes
-        clean_str = top_types_str.strip("{}").replace("'", '"')
-        if not clean_str:
+        result = json.loads(top_types_str)
+    except ValueError:
+        try:
+            result = ast.literal_eval(top_types_str)
+        except (ValueError, SyntaxError):
             return {}
-
-        # Simple parsing for the format: "KEY": VALUE, "KEY2": VALUE2
-        result = {}
-        # Split by comma, but be careful about commas in the values
-        parts = clean_str.split(",")
-        for part in parts:
-            part = part.strip()
-            if ":" in part:
-                # Split by first colon
-                colon_pos = part.find(":")
-                key = part[:colon_pos].strip().strip('"')
-                value_str = part[colon_pos + 1 :].strip()
-                try:
-                    result[key] = int(value_str)
-                except ValueError:
-                    continue
-
-        return result
-    except Exception:
-        return {}
+    return result if isinstance(result, dict) else {}
 
 
 def get_severity(top_types: dict[str, int]) -> str:
@@ -71,13 +64,11 @@ def get_severity(top_types: dict[str, int]) -> str:
         return "NONE"
 
     # CRITICAL entities
-    critical_types = {"ID", "CREDIT_CARD", "BANK_ROUTING", "DRIVER_LICENSE"}
-    if any(entity_type in critical_types for entity_type in top_types):
+    if not CRITICAL_TYPES.isdisjoint(top_types):
         return "CRITICAL"
 
     # MEDIUM entities
-    medium_types = {"PHONE_NUMBER", "EIN", "ZIP", "ADDRESS"}
-    if any(entity_type in medium_types for entity_type in top_types):
+    if not MEDIUM_TYPES.isdisjoint(top_types):
         return "MEDIUM"
 
     # LOW - any other entities present
@@ -90,6 +81,12 @@ def severity_sort_key(severity: str) -> int:
     return severity_order.get(severity, 0)
 
 
+# Most severe first, then most controlled, most total and most recent
+_ROW_SORT_KEY = itemgetter(
+    "_sev_key", "_controlled_int", "_total_int", "Modified (UTC)"
+)
+
+
 def format_table_row(row: dict[str, str]) -> dict[str, str]:
     """
     Format a CSV row for display.
@@ -118,12 +115,15 @@ def format_table_row(row: dict[str, str]) -> dict[str, str]:
     # Get basename
     filename = Path(file_path).name if file_path else "unknown"
 
-    # Format modified date
-    try:
-        dt = datetime.fromisoformat(modified.replace("Z", "+00:00"))
-        modified_utc = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-    except (ValueError, AttributeError):
-        modified_utc = modified
+    # Format modified date; ISO timestamps only need reshaping
+    if len(modified) >= 19 and modified[10] == "T" and modified[16] == ":":
+        modified_utc = f"{modified[:10]} {modified[11:19]} UTC"
+    else:
+        try:
+            dt = datetime.fromisoformat(modified.replace("Z", "+00:00"))
+            modified_utc = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+        except (ValueError, AttributeError):
+            modified_utc = modified
 
     return {
         "SUSPECT?": suspect,
@@ -133,11 +133,14 @@ def format_table_row(row: dict[str, str]) -> dict[str, str]:
         "Total": str(total),
         "Modified (UTC)": modified_utc,
         "File": filename,
+        "_sev_key": severity_sort_key(severity),
+        "_controlled_int": controlled,
+        "_total_int": total,
     }
 
 
 def print_table(
-    rows: list[dict[str, str]],
+    rows: Iterable[dict[str, str]],
     min_sev: str | None = None,
     only_suspect: bool = False,
     limit: int = 200,
@@ -146,45 +149,39 @@ def print_table(
     Print formatted table.
 
     Args:
-        rows: List of formatted rows
+        rows: Formatted rows (any iterable, consumed once)
         min_sev: Minimum severity filter
         only_suspect: Show only suspect files
         limit: Maximum number of rows to show
     """
-    if not rows:
-        print("No data available yet.")
-        return
+    seen = 0
+    min_sev_key = severity_sort_key(min_sev) if min_sev else 0
 
-    # Apply filters
-    filtered_rows = []
-    for row in rows:
-        # Only suspect filter
-        if only_suspect and row["SUSPECT?"] == "NO":
-            continue
-
-        # Minimum severity filter
-        if min_sev:
-            current_sev = severity_sort_key(row["Severity"])
-            min_sev_key = severity_sort_key(min_sev)
-            if current_sev < min_sev_key:
+    def matching():
+        nonlocal seen
+        for row in rows:
+            seen += 1
+
+            # Only suspect filter
+            if only_suspect and row["SUSPECT?"] == "NO":
                 continue
 
-        filtered_rows.append(row)
-
-    # Sort by: Severity desc, Controlled desc, Total desc, modified desc
-    filtered_rows.sort(
-        key=lambda x: (
-            -severity_sort_key(x["Severity"]),
-            -int(x["Controlled"]),
-            -int(x["Total"]),
-            x["Modified (UTC)"],
-        ),
-        reverse=True,
-    )
+            # Minimum severity filter
+            if row["_sev_key"] < min_sev_key:
+                continue
+
+            yield row
 
-    # Apply limit
+    # Sort by: Severity desc, Controlled desc, Total desc, modified desc,
+    # keeping only the top `limit` rows in a heap
     if limit > 0:
-        filtered_rows = filtered_rows[:limit]
+        filtered_rows = heapq.nlargest(limit, matching(), key=_ROW_SORT_KEY)
+    else:
+        filtered_rows = sorted(matching(), key=_ROW_SORT_KEY, reverse=True)
+
+    if not seen:
+        print("No data available yet.")
+        return
 
     if not filtered_rows:
         print("No files match the specified filters.")
@@ -212,18 +209,27 @@ def print_table(
     print(f"\nTotal files shown: {len(filtered_rows)}")
 
 
-def read_summary_csv(summary_path: Path) -> list[dict[str, str]]:
+def read_summary_csv(summary_path: Path) -> Iterator[dict[str, str]]:
     """
     Read and parse summary.csv file.
 
     Args:
         summary_path: Path to summary.csv
 
-    Returns:
-        List of formatted rows
+    Yields:
+        Formatted rows
     """
-    if not summary_path.exists():
-        return []
+    try:
+        st = summary_path.stat()
+    except FileNotFoundError:
+        return
+
+    # Reuse the parsed rows while the file is unchanged between refreshes
+    key = (st.st_mtime_ns, st.st_size)
+    cached = getattr(read_summary_csv, "_cache", None)
+    if cached is not None and cached[0] == (summary_path, key):
+        yield from cached[1]
+        return
 
     try:
         rows = []
@@ -232,10 +238,10 @@ def read_summary_csv(summary_path: Path) -> list[dict[str, str]]:
             for row in reader:
                 formatted_row = format_table_row(row)
                 rows.append(formatted_row)
-        return rows
+                yield formatted_row
+        read_summary_csv._cache = ((summary_path, key), rows)
     except Exception as e:
         print(f"Error reading summary.csv: {e}", file=sys.stderr)
-        return []
 
 
 def main():
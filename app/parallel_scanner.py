@@ -5,37 +5,86 @@ Parallel PII scanning for high-performance processing.
 import gc
 import multiprocessing as mp
 import queue
+import threading
 import time
 from collections.abc import Callable
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
 import psutil
 
-from app.progress import ProgressMonitor, ProgressTracker
+from app import fastjson
+from app.progress import BatchedProgress, ProgressMonitor, ProgressTracker
 from ingest.csv_stream import StreamingCSVProcessor, get_csv_info
 from ingest.dispatch import extract_text_stream
-from pii.engine import hits_from_text
+from pii.engine import get_analyzer, hits_from_text
+from pii.recognizers import prepare_fallback_matcher
+
+# Chunks handed to a process pool before it is replaced with fresh workers
+RECYCLE_EVERY = 512
+
+# Text chunks sent to a worker per task, amortizing pickling and scheduling
+CHUNK_BATCH = 64
 
 
 class ParallelPIIScanner:
     """High-performance parallel PII scanner for large files."""
 
-    def __init__(self, max_workers: int | None = None, max_memory_mb: int = 1000):
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_memory_mb: int = 1000,
+        executor_cls: type[Executor] = ThreadPoolExecutor,
+    ):
         """
         Initialize parallel scanner.
 
         Args:
-            max_workers: Maximum number of worker processes (default: CPU count)
+            max_workers: Maximum number of workers (default: CPU count)
             max_memory_mb: Maximum memory usage in MB
+            executor_cls: Pool type; threads share the analyzer and skip
+                pickling chunks, ProcessPoolExecutor sidesteps the GIL for
+                CPU-bound regex scanning
         """
         self.max_workers = max_workers or min(
             mp.cpu_count(), 8
         )  # Cap at 8 for efficiency
         self.max_memory_mb = max_memory_mb
-        self.chunk_queue = queue.Queue()
-        self.result_queue = queue.Queue()
+        self.executor_cls = executor_cls
+        self.memory_manager = MemoryManager()
+
+        # Worker pool reused across files, created on first use
+        self._pool: Executor | None = None
+        self._tasks_since_recycle = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> Executor:
+        """Return the persistent worker pool, starting it on first use."""
+        if self._pool is None:
+            self._pool = self.executor_cls(
+                max_workers=self.max_workers, initializer=_init_worker
+            )
+        return self._pool
 
     def scan_large_file(
         self,
@@ -44,6 +93,7 @@ class ParallelPIIScanner:
         chunk_size: int = 4000,
         overlap: int = 200,
         progress_callback: Callable | None = None,
+        out_jsonl: Path | None = None,
     ) -> dict[str, Any]:
         """
         Scan large file with parallel processing.
@@ -51,9 +101,15 @@ class ParallelPIIScanner:
         Args:
             file_path: Path to file to scan
             out_dir: Output directory for results
-            chunk_size: Text chunk size for processing
+            chunk_size: Text chunk size for PII detection
             overlap: Overlap between chunks
             progress_callback: Optional progress callback function
+            out_jsonl: Stream hits to this JSONL file instead of returning
+                them in ``entities``
+
+        Text is read in blocks sized by MemoryManager.get_optimal_chunk_size
+        for the available memory, and each block is scanned in chunk_size
+        pieces.
 
         Returns:
             Dictionary with scan results and statistics
@@ -66,6 +122,12 @@ class ParallelPIIScanner:
         monitor = ProgressMonitor(tracker)
 
         try:
+            # Size read blocks to the memory currently available
+            file_size = file_path.stat().st_size
+            read_size = self.memory_manager.get_optimal_chunk_size(
+                file_size / (1024 * 1024)
+            )
+
             # Get file info
             if file_path.suffix.lower() == ".csv":
                 file_info = get_csv_info(file_path)
@@ -76,14 +138,25 @@ class ParallelPIIScanner:
 
                 # Use streaming CSV processor
                 result = self._scan_csv_parallel(
-                    file_path, out_dir, tracker, chunk_size, overlap
+                    file_path,
+                    out_dir,
+                    tracker,
+                    chunk_size,
+                    overlap,
+                    out_jsonl,
+                    read_size,
                 )
             else:
                 # Use regular file processor
-                file_size = file_path.stat().st_size
                 print(f"📊 File Info: {file_size / (1024*1024):.1f} MB")
                 result = self._scan_file_parallel(
-                    file_path, out_dir, tracker, chunk_size, overlap
+                    file_path,
+                    out_dir,
+                    tracker,
+                    chunk_size,
+                    overlap,
+                    out_jsonl,
+                    read_size,
                 )
 
             # Start progress monitoring
@@ -107,6 +180,8 @@ class ParallelPIIScanner:
         tracker: ProgressTracker,
         chunk_size: int,
         overlap: int,
+        out_jsonl: Path | None = None,
+        read_size: int | None = None,
     ) -> dict[str, Any]:
         """Scan CSV file with parallel processing."""
         all_entities = []
@@ -114,39 +189,38 @@ class ParallelPIIScanner:
         # Create streaming processor
         csv_processor = StreamingCSVProcessor(file_path, self.max_memory_mb // 2)
 
-        # Process in chunks with multiple workers
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
+        with self._open_sink(out_jsonl, all_entities) as sink:
+            # Process in batches of chunks with the shared worker pool
+            futures = set()
+            batch = []
 
-            for text_chunk in csv_processor.stream_concatenated_text(
-                chunk_rows=1000, max_chars=chunk_size
+            for text_chunk, byte_count in csv_processor.stream_concatenated_text(
+                chunk_rows=1000, max_chars=read_size or chunk_size, with_sizes=True
             ):
-                if text_chunk.strip():
-                    # Submit chunk for parallel processing
-                    future = executor.submit(
-                        _process_text_chunk, text_chunk, chunk_size, overlap
-                    )
-                    futures.append(future)
+                if text_chunk and not text_chunk.isspace():
+                    batch.append(text_chunk)
+                    if len(batch) >= CHUNK_BATCH:
+                        self._submit_batch(futures, batch, chunk_size, overlap)
+                        batch = []
 
                 # Update progress
                 rows_processed, total_rows, progress_pct = csv_processor.get_progress()
                 tracker.update(
                     processed=rows_processed - tracker.processed_items,
-                    bytes_count=len(text_chunk.encode("utf-8")),
+                    bytes_count=byte_count,
                 )
 
                 # Limit number of pending futures to manage memory
                 if len(futures) >= self.max_workers * 2:
-                    self._collect_results(futures, all_entities, tracker)
+                    self._collect_results(futures, sink, tracker)
+
+            if batch:
+                self._submit_batch(futures, batch, chunk_size, overlap)
 
             # Collect remaining results
-            self._collect_results(futures, all_entities, tracker)
+            self._collect_results(futures, sink, tracker, drain=True)
 
-        return {
-            "entities": all_entities,
-            "stats": tracker.get_stats(),
-            "file_path": str(file_path),
-        }
+        return self._scan_result(file_path, tracker, all_entities, out_jsonl)
 
     def _scan_file_parallel(
         self,
@@ -155,53 +229,107 @@ class ParallelPIIScanner:
         tracker: ProgressTracker,
         chunk_size: int,
         overlap: int,
+        out_jsonl: Path | None = None,
+        read_size: int | None = None,
     ) -> dict[str, Any]:
         """Scan regular file with parallel processing."""
         all_entities = []
 
         try:
-            # Extract text using streaming
-            text_generator = extract_text_stream(file_path, chunk_size)
-
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = []
+            # Extract text using streaming; text files stay raw bytes and are
+            # decoded by the workers
+            text_generator = extract_text_stream(
+                file_path, read_size or chunk_size, binary=True
+            )
+
+            with (
+                self._open_sink(out_jsonl, all_entities) as sink,
+                BatchedProgress(tracker) as progress,
+            ):
+                futures = set()
+                batch = []
 
                 for text_chunk in text_generator:
-                    if text_chunk.strip():
-                        # Submit chunk for parallel processing
-                        future = executor.submit(
-                            _process_text_chunk, text_chunk, chunk_size, overlap
-                        )
-                        futures.append(future)
+                    if text_chunk and not text_chunk.isspace():
+                        batch.append(text_chunk)
+                        if len(batch) >= CHUNK_BATCH:
+                            self._submit_batch(futures, batch, chunk_size, overlap)
+                            batch = []
 
                         # Update progress
-                        tracker.update(
-                            processed=1, bytes_count=len(text_chunk.encode("utf-8"))
-                        )
+                        progress.update(processed=1, bytes_count=len(text_chunk))
 
                         # Limit pending futures
                         if len(futures) >= self.max_workers * 2:
-                            self._collect_results(futures, all_entities, tracker)
+                            self._collect_results(futures, sink, progress)
+
+                if batch:
+                    self._submit_batch(futures, batch, chunk_size, overlap)
 
                 # Collect remaining results
-                self._collect_results(futures, all_entities, tracker)
+                self._collect_results(futures, sink, progress, drain=True)
 
         except Exception as e:
             print(f"Error processing file: {e}")
 
-        return {
+        return self._scan_result(file_path, tracker, all_entities, out_jsonl)
+
+    def _open_sink(self, out_jsonl: Path | None, all_entities: list):
+        """Return a context yielding where hits go: a JSONL writer or the list."""
+        if out_jsonl:
+            return HitWriter(out_jsonl, maxsize=self.max_workers * 4)
+        return nullcontext(all_entities)
+
+    def _scan_result(
+        self,
+        file_path: Path,
+        tracker: ProgressTracker,
+        all_entities: list,
+        out_jsonl: Path | None,
+    ) -> dict[str, Any]:
+        """Build the result dictionary of a parallel scan."""
+        result = {
             "entities": all_entities,
             "stats": tracker.get_stats(),
             "file_path": str(file_path),
         }
+        if out_jsonl:
+            result["out_jsonl"] = str(out_jsonl)
+        return result
+
+    def _submit_batch(
+        self, futures: set, batch: list[str | bytes], chunk_size: int, overlap: int
+    ):
+        """Submit a batch of text chunks to the pool as a single task."""
+        futures.add(
+            self._get_pool().submit(_process_text_batch, batch, chunk_size, overlap)
+        )
+        self._tasks_since_recycle += len(batch)
 
     def _collect_results(
-        self, futures: list, all_entities: list, tracker: ProgressTracker
+        self,
+        futures: set,
+        all_entities: "list | HitWriter",
+        tracker: ProgressTracker | BatchedProgress,
+        drain: bool = False,
     ):
-        """Collect results from completed futures."""
-        completed_futures = []
+        """
+        Collect results from completed futures.
+
+        Blocks until at least one future finishes (all of them when ``drain``
+        is set or memory is short), so the producer resumes as soon as a
+        worker frees up.
+        """
+        # Under memory pressure, let everything in flight finish before the
+        # producer submits more
+        pressure = not drain and self.memory_manager.should_trigger_gc()
 
-        for future in as_completed(futures, timeout=1):
+        completed_futures, _ = wait(
+            futures,
+            return_when=ALL_COMPLETED if drain or pressure else FIRST_COMPLETED,
+        )
+
+        for future in completed_futures:
             try:
                 entities = future.result()
                 all_entities.extend(entities)
@@ -216,27 +344,118 @@ class ParallelPIIScanner:
                     noncontrolled=noncontrolled,
                 )
 
-                completed_futures.append(future)
-
             except Exception as e:
                 print(f"Warning: Chunk processing failed: {e}")
-                completed_futures.append(future)
 
         # Remove completed futures
-        for future in completed_futures:
-            if future in futures:
-                futures.remove(future)
+        futures -= completed_futures
+
+        if pressure:
+            self.memory_manager.cleanup_if_needed()
+
+        if self._tasks_since_recycle >= RECYCLE_EVERY:
+            self._recycle_pool()
+
+    def _recycle_pool(self):
+        """
+        Replace long-lived worker processes to bound their memory growth.
+
+        Chunks still in flight finish on the old pool before it shuts down.
+        Thread pools share the parent's heap, so they are left running.
+        """
+        self._tasks_since_recycle = 0
+        if self._pool is not None and isinstance(self._pool, ProcessPoolExecutor):
+            self.close()
+
+
+class HitWriter:
+    """
+    Write entity hits to a JSONL file from a background thread.
+
+    Scan loops hand result batches to ``extend`` in place of a list, so hits
+    are never accumulated in memory. The bounded queue blocks the producer
+    if the writer falls behind.
+    """
 
-        # Memory cleanup
-        gc.collect()
+    def __init__(self, path: Path, maxsize: int = 16):
+        """
+        Open the output file and start the writer thread.
+
+        Args:
+            path: JSONL file to write
+            maxsize: Maximum number of result batches waiting to be written
+        """
+        self.path = path
+        self.count = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+        # Kept open for the writer thread and closed in close()
+        self._file = open(path, "wb")  # noqa: SIM115
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def extend(self, entities: list):
+        """Queue a batch of hits for writing."""
+        if entities:
+            self._queue.put(entities)
+
+    def close(self):
+        """Write any queued hits, stop the thread and close the file."""
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+    def _run(self):
+        write = self._file.write
+        failed = False
+
+        while (entities := self._queue.get()) is not None:
+            # Keep draining after a write error so producers never block
+            if failed:
+                continue
+            try:
+                # One encode and one write per result batch, not per hit
+                write(fastjson.dumps_lines(entities))
+                self.count += len(entities)
+            except OSError as e:
+                print(f"Warning: Could not write hits to {self.path}: {e}")
+                failed = True
 
 
-def _process_text_chunk(text: str, chunk_size: int, overlap: int):
+def _init_worker():
+    """
+    Build the shared analyzer and fallback matcher once, when a pool worker
+    starts, rather than on the worker's first chunk.
+    """
+    get_analyzer()
+    prepare_fallback_matcher()
+
+
+def _process_text_batch(texts: list[str | bytes], chunk_size: int, overlap: int):
+    """
+    Process a batch of text chunks in one worker task.
+    Returns the entities of all chunks, in order.
+    """
+    entities = []
+    for text in texts:
+        entities.extend(_process_text_chunk(text, chunk_size, overlap))
+    return entities
+
+
+def _process_text_chunk(text: str | bytes, chunk_size: int, overlap: int):
     """
     Process a single text chunk for PII entities.
-    This function runs in a separate process.
+    This function runs in a pool worker thread or process.
+    Raw UTF-8 bytes are decoded here so the parent never has to.
     """
     try:
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", errors="ignore")
         entities = hits_from_text(text, chunk_size, overlap)
         return entities
     except Exception as e:
@@ -244,6 +463,10 @@ def _process_text_chunk(text: str, chunk_size: int, overlap: int):
         return []
 
 
+# Seconds to reuse a psutil.virtual_memory() reading
+MEMORY_CACHE_TTL = 2.0
+
+
 class MemoryManager:
     """Intelligent memory management for large file processing."""
 
@@ -255,11 +478,21 @@ class MemoryManager:
             max_memory_pct: Maximum memory usage percentage
         """
         self.max_memory_pct = max_memory_pct
-        self.initial_memory = psutil.virtual_memory().available
+        self._memory = psutil.virtual_memory()
+        self._memory_time = time.monotonic()
+        self.initial_memory = self._memory.available
+
+    def _virtual_memory(self):
+        """System memory stats, re-queried at most every MEMORY_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if now - self._memory_time >= MEMORY_CACHE_TTL:
+            self._memory = psutil.virtual_memory()
+            self._memory_time = now
+        return self._memory
 
     def get_available_memory_mb(self) -> float:
         """Get available memory in MB."""
-        return psutil.virtual_memory().available / (1024 * 1024)
+        return self._virtual_memory().available / (1024 * 1024)
 
     def get_optimal_chunk_size(self, file_size_mb: float) -> int:
         """Calculate optimal chunk size based on available memory."""
@@ -273,7 +506,7 @@ class MemoryManager:
 
     def should_trigger_gc(self) -> bool:
         """Check if garbage collection should be triggered."""
-        current_memory = psutil.virtual_memory()
+        current_memory = self._virtual_memory()
         memory_usage_pct = (1 - current_memory.available / current_memory.total) * 100
 
         return memory_usage_pct > self.max_memory_pct
@@ -286,7 +519,7 @@ class MemoryManager:
     def get_optimal_workers(self) -> int:
         """Get optimal number of worker processes based on system resources."""
         cpu_count = mp.cpu_count()
-        memory_gb = psutil.virtual_memory().total / (1024**3)
+        memory_gb = self._virtual_memory().total / (1024**3)
 
         # Estimate workers based on memory (assume 200MB per worker)
         memory_workers = max(int(memory_gb * 1024 / 200), 1)
@@ -5,12 +5,68 @@ detection system, handling text extraction, entity detection, and result
 aggregation.
 """
 
-import json
+import os
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from heapq import nlargest
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from ingest import iter_file_text
 from pii import FileSummary, hits_from_text
 
+from . import fastjson
+
+# Output buffer for the JSONL file
+JSONL_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Most entity types kept in a summary's top_types; above the number of types
+# the recognizers produce, so severity checks still see every type found
+TOP_TYPES_LIMIT = 32
+
+_hit_label = attrgetter("label")
+_hit_entity_type = attrgetter("entity_type")
+_type_count = itemgetter(1)
+
+
+def _discard_hits(hits: list):
+    """Hit sink used when no JSONL output was requested."""
+
+
+def _scan_blocks(
+    blocks: Iterable[str], scan: Callable[[str], list], workers: int
+) -> Iterator[list]:
+    """Yield scan(block) for every block, in order, using up to workers threads.
+
+    Files that produce a single block are scanned inline without starting a
+    pool. Otherwise at most ``2 * workers`` blocks are in flight at once.
+    """
+    blocks = iter(blocks)
+    first = next(blocks, None)
+    if first is None:
+        return
+    second = next(blocks, None)
+
+    if second is None or workers <= 1:
+        yield scan(first)
+        if second is not None:
+            yield scan(second)
+            yield from map(scan, blocks)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque([pool.submit(scan, first), pool.submit(scan, second)])
+        for block in blocks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(scan, block))
+
+        while pending:
+            yield pending.popleft().result()
+
 
 def scan_file_once(
     path: Path,
@@ -20,6 +76,7 @@ def scan_file_once(
     chunk_size: int = 2000,
     overlap: int = 100,
     out_jsonl: Path | None = None,
+    workers: int | None = None,
 ) -> FileSummary:
     """Scan a file for PII entities and generate a summary.
 
@@ -44,6 +101,9 @@ def scan_file_once(
         Character overlap between chunks to catch boundary entities (default: 100).
     out_jsonl : Path, optional
         Path to write detected entities as JSON lines for detailed analysis.
+    workers : int, optional
+        Threads scanning text blocks concurrently; 1 scans sequentially
+        (default: CPU count, capped at 8).
 
     Returns
     -------
@@ -70,78 +130,55 @@ def scan_file_once(
     # Default supported extensions
     if exts is None:
         exts = {".txt", ".csv", ".log", ".md", ".html", ".pdf"}
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 8)
 
     # Initialize counters (memory-efficient)
     total_count = 0
-    controlled_count = 0
-    noncontrolled_count = 0
-    entity_type_counts = {}
+    label_counts = Counter()
+    entity_type_counts = Counter()
+
+    with ExitStack() as stack:
+        # Open JSONL output file if specified; each block's hits are encoded
+        # into one buffer and written with a single call
+        write_hits = _discard_hits
+        if out_jsonl:
+            jsonl_file = stack.enter_context(
+                open(out_jsonl, "wb", buffering=JSONL_BUFFER_BYTES)
+            )
 
-    # Open JSONL output file if specified
-    jsonl_file = None
-    if out_jsonl:
-        jsonl_file = open(out_jsonl, "w", encoding="utf-8")
+            def write_hits(hits):
+                if hits:
+                    jsonl_file.write(fastjson.dumps_lines(hits))
 
-    try:
         # Stream text blocks from the file
-        for text_block in iter_file_text(
+        text_blocks = iter_file_text(
             path=path,
             exts=exts,
             text_chunk_bytes=text_chunk_bytes,
             pdf_max_pages=pdf_max_pages,
-        ):
-            # Process each text block for PII
-            hits = hits_from_text(
-                text=text_block, chunk_size=chunk_size, overlap=overlap
-            )
+        )
+        scan = partial(hits_from_text, chunk_size=chunk_size, overlap=overlap)
 
-            # Update counters (don't store hits in memory)
-            for hit in hits:
-                total_count += 1
-                if hit.label == "Controlled":
-                    controlled_count += 1
-                elif hit.label == "NonControlled":
-                    noncontrolled_count += 1
-
-                # Count entity types
-                entity_type_counts[hit.entity_type] = (
-                    entity_type_counts.get(hit.entity_type, 0) + 1
-                )
-
-                # Write to JSONL if specified
-                if jsonl_file:
-                    hit_dict = {
-                        "entity_type": hit.entity_type,
-                        "value": hit.value,
-                        "start": hit.start,
-                        "end": hit.end,
-                        "score": hit.score,
-                        "label": hit.label,
-                        "context_left": hit.context_left,
-                        "context_right": hit.context_right,
-                    }
-                    jsonl_file.write(json.dumps(hit_dict) + "\n")
-                    jsonl_file.flush()  # Ensure immediate writing
+        # Process each text block for PII, several blocks at a time
+        for hits in _scan_blocks(text_blocks, scan, workers):
+            # Update counters once per block (don't store hits in memory)
+            total_count += len(hits)
+            label_counts.update(map(_hit_label, hits))
+            entity_type_counts.update(map(_hit_entity_type, hits))
+            write_hits(hits)
 
             # Clear hits from memory after processing
             del hits
 
-    finally:
-        # Close JSONL file if open
-        if jsonl_file:
-            jsonl_file.close()
-
-    # Generate summary
+    # Generate summary, with top types sorted by count (descending)
     summary = FileSummary(
         total=total_count,
-        controlled=controlled_count,
-        noncontrolled=noncontrolled_count,
-        top_types=entity_type_counts,
-    )
-
-    # Sort top types by count (descending)
-    summary.top_types = dict(
-        sorted(summary.top_types.items(), key=lambda x: x[1], reverse=True)
+        controlled=label_counts["Controlled"],
+        noncontrolled=label_counts["NonControlled"],
+        top_types=dict(
+            nlargest(TOP_TYPES_LIMIT, entity_type_counts.items(), key=_type_count)
+        ),
     )
 
     return summary
@@ -3,16 +3,93 @@ Progress tracking and monitoring for PII scanning operations.
 """
 
 import json
+import os
+import queue
+import sys
 import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from . import fastjson
+
+# Positions of the counters in a ProgressTracker counter row
+(
+    _PROCESSED,
+    _ENTITIES,
+    _CONTROLLED,
+    _NONCONTROLLED,
+    _FILES,
+    _BYTES,
+) = range(6)
+
+
+def _counter(index: int, doc: str) -> property:
+    """Expose one of a tracker's summed counters as an attribute."""
+
+    def get(self) -> int:
+        return self._totals()[index]
+
+    def set(self, value: int):
+        with self.lock:
+            self._base[index] += value - self._totals()[index]
+
+    return property(get, set, doc=doc)
+
+
+# Every state of the default-width progress bar, indexed by filled cells
+BAR_WIDTH = 30
+_BARS = tuple(
+    f"[{'█' * filled}{'░' * (BAR_WIDTH - filled)}]" for filled in range(BAR_WIDTH + 1)
+)
+
+
+@lru_cache(maxsize=4)
+def _iso_timestamp(seconds: int) -> str:
+    """Render a whole-second Unix timestamp in ISO format (cached)."""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+@lru_cache(maxsize=512)
+def _format_duration(seconds: float) -> str:
+    """Format duration in human readable format (cached)."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    elif seconds < 3600:
+        minutes = int(seconds // 60)
+        secs = int(seconds % 60)
+        return f"{minutes}m{secs:02d}s"
+    else:
+        hours = int(seconds // 3600)
+        minutes = int((seconds % 3600) // 60)
+        return f"{hours}h{minutes:02d}m"
+
+
+@lru_cache(maxsize=512)
+def _format_bytes(bytes_count: int) -> str:
+    """Format a whole number of bytes in human readable format (cached)."""
+    size = float(bytes_count)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024.0:
+            return f"{size:.1f}{unit}"
+        size /= 1024.0
+    return f"{size:.1f}PB"
+
 
 class ProgressTracker:
     """Real-time progress tracking for PII scanning operations."""
 
+    processed_items = _counter(_PROCESSED, "Number of items processed")
+    entities_found = _counter(_ENTITIES, "Number of entities found")
+    controlled_entities = _counter(_CONTROLLED, "Number of controlled entities")
+    noncontrolled_entities = _counter(
+        _NONCONTROLLED, "Number of non-controlled entities"
+    )
+    files_processed = _counter(_FILES, "Number of files processed")
+    bytes_processed = _counter(_BYTES, "Number of bytes processed")
+
     def __init__(self, operation_id: str, total_items: int | None = None):
         """
         Initialize progress tracker.
@@ -23,20 +100,23 @@ class ProgressTracker:
         """
         self.operation_id = operation_id
         self.total_items = total_items
-        self.processed_items = 0
         self.start_time = time.time()
         self.last_update = self.start_time
         self.lock = threading.Lock()
 
-        # Statistics
-        self.entities_found = 0
-        self.controlled_entities = 0
-        self.noncontrolled_entities = 0
-        self.files_processed = 0
-        self.bytes_processed = 0
+        # start_time never changes, so it is rendered for get_stats() once
+        self._start_iso = datetime.fromtimestamp(self.start_time).isoformat()
+
+        # Statistics: each updating thread owns a counter row that only it
+        # writes, so updates need no lock; readers sum the rows. The base row
+        # holds values assigned directly or restored from a checkpoint
+        self._base = [0] * 6
+        self._rows = [self._base]
+        self._local = threading.local()
 
         # Resume capability
         self.checkpoint_file = None
+        self._last_checkpoint = None
 
     def set_total(self, total: int):
         """Set total number of items."""
@@ -61,63 +141,104 @@ class ProgressTracker:
             noncontrolled: Number of non-controlled entities
             bytes_count: Number of bytes processed
         """
-        with self.lock:
-            self.processed_items += processed
-            self.entities_found += entities
-            self.controlled_entities += controlled
-            self.noncontrolled_entities += noncontrolled
-            self.bytes_processed += bytes_count
-            self.last_update = time.time()
+        row = self._thread_row()
+        row[_PROCESSED] += processed
+        row[_ENTITIES] += entities
+        row[_CONTROLLED] += controlled
+        row[_NONCONTROLLED] += noncontrolled
+        row[_BYTES] += bytes_count
+        self.last_update = time.time()
 
     def increment_files(self, count: int = 1):
         """Increment file counter."""
+        self._thread_row()[_FILES] += count
+        self.last_update = time.time()
+
+    def reset_counters(self):
+        """Zero every counter, e.g. before a failed pass is redone from the start.
+
+        Must not race with updates from other threads.
+        """
         with self.lock:
-            self.files_processed += count
+            for row in self._rows:
+                row[:] = [0] * 6
+            self._last_checkpoint = None
+        self.last_update = time.time()
+
+    def _thread_row(self) -> list[int]:
+        """Return the calling thread's counter row, registering it on first use."""
+        try:
+            return self._local.row
+        except AttributeError:
+            row = self._local.row = [0] * 6
+            with self.lock:
+                self._rows.append(row)
+            return row
+
+    def _totals(self) -> list[int]:
+        """Sum every thread's counter row into current totals."""
+        return [sum(column) for column in zip(*self._rows)]
 
     def get_stats(self) -> dict[str, Any]:
-        """Get current progress statistics."""
-        with self.lock:
-            current_time = time.time()
-            elapsed = current_time - self.start_time
-
-            # Calculate rates
-            items_per_sec = self.processed_items / elapsed if elapsed > 0 else 0
-            bytes_per_sec = self.bytes_processed / elapsed if elapsed > 0 else 0
-
-            # Calculate progress percentage
-            progress_pct = 0.0
-            if self.total_items and self.total_items > 0:
-                progress_pct = min(
-                    (self.processed_items / self.total_items) * 100, 100.0
-                )
-
-            # Estimate completion time
-            eta_seconds = None
-            if self.total_items and items_per_sec > 0:
-                remaining_items = self.total_items - self.processed_items
-                eta_seconds = remaining_items / items_per_sec
-
-            return {
-                "operation_id": self.operation_id,
-                "processed_items": self.processed_items,
-                "total_items": self.total_items,
-                "progress_percentage": round(progress_pct, 2),
-                "elapsed_seconds": round(elapsed, 2),
-                "eta_seconds": round(eta_seconds, 2) if eta_seconds else None,
-                "items_per_second": round(items_per_sec, 2),
-                "bytes_processed": self.bytes_processed,
-                "bytes_per_second": round(bytes_per_sec, 2),
-                "files_processed": self.files_processed,
-                "entities_found": self.entities_found,
-                "controlled_entities": self.controlled_entities,
-                "noncontrolled_entities": self.noncontrolled_entities,
-                "start_time": datetime.fromtimestamp(self.start_time).isoformat(),
-                "last_update": datetime.fromtimestamp(self.last_update).isoformat(),
-            }
+        """
+        Get current progress statistics.
 
-    def print_progress(self, prefix: str = "Progress"):
-        """Print formatted progress to console."""
-        stats = self.get_stats()
+        Reads the counters without taking the lock, so a snapshot never
+        stalls updating threads; counters may be a few updates apart from
+        one another, which is fine for progress display.
+        """
+        (
+            processed_items,
+            entities_found,
+            controlled_entities,
+            noncontrolled_entities,
+            files_processed,
+            bytes_processed,
+        ) = self._totals()
+        total_items = self.total_items
+
+        current_time = time.time()
+        elapsed = current_time - self.start_time
+
+        # Calculate rates
+        items_per_sec = processed_items / elapsed if elapsed > 0 else 0
+        bytes_per_sec = bytes_processed / elapsed if elapsed > 0 else 0
+
+        # Calculate progress percentage
+        progress_pct = 0.0
+        if total_items and total_items > 0:
+            progress_pct = min(processed_items * 100 / total_items, 100.0)
+
+        # Estimate completion time
+        eta_seconds = None
+        if total_items and items_per_sec > 0:
+            remaining_items = total_items - processed_items
+            eta_seconds = remaining_items / items_per_sec
+
+        return {
+            "operation_id": self.operation_id,
+            "processed_items": processed_items,
+            "total_items": total_items,
+            "progress_percentage": round(progress_pct, 2),
+            "elapsed_seconds": round(elapsed, 2),
+            "eta_seconds": round(eta_seconds, 2) if eta_seconds else None,
+            "items_per_second": round(items_per_sec, 2),
+            "bytes_processed": bytes_processed,
+            "bytes_per_second": round(bytes_per_sec, 2),
+            "files_processed": files_processed,
+            "entities_found": entities_found,
+            "controlled_entities": controlled_entities,
+            "noncontrolled_entities": noncontrolled_entities,
+            "start_time": self._start_iso,
+            "last_update": _iso_timestamp(int(self.last_update)),
+        }
+
+    def print_progress(
+        self, prefix: str = "Progress", stats: dict[str, Any] | None = None
+    ):
+        """Print formatted progress to console, from ``stats`` if given."""
+        if stats is None:
+            stats = self.get_stats()
 
         # Format elapsed time
         elapsed = stats["elapsed_seconds"]
@@ -135,64 +256,74 @@ class ProgressTracker:
         # Progress bar
         if stats["total_items"]:
             progress_bar = self._create_progress_bar(stats["progress_percentage"])
-            print(
+            line = (
                 f"\r{prefix}: {progress_bar} {stats['progress_percentage']:.1f}% "
                 f"({stats['processed_items']}/{stats['total_items']}) "
                 f"| {bytes_str} @ {rate_str} | {elapsed_str} | ETA: {eta_str} "
-                f"| Entities: {stats['entities_found']} ({stats['controlled_entities']}C/{stats['noncontrolled_entities']}NC)",
-                end="",
-                flush=True,
+                f"| Entities: {stats['entities_found']} ({stats['controlled_entities']}C/{stats['noncontrolled_entities']}NC)"
             )
         else:
-            print(
+            line = (
                 f"\r{prefix}: {stats['processed_items']} items | {bytes_str} @ {rate_str} "
                 f"| {elapsed_str} | Entities: {stats['entities_found']} "
-                f"({stats['controlled_entities']}C/{stats['noncontrolled_entities']}NC)",
-                end="",
-                flush=True,
+                f"({stats['controlled_entities']}C/{stats['noncontrolled_entities']}NC)"
             )
 
+        # Whole line in one write and one flush
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
     def _create_progress_bar(self, percentage: float, width: int = 30) -> str:
         """Create ASCII progress bar."""
         filled = int(width * percentage / 100)
+        if width == BAR_WIDTH:
+            return _BARS[filled]
         bar = "█" * filled + "░" * (width - filled)
         return f"[{bar}]"
 
-    def _format_duration(self, seconds: float) -> str:
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
         """Format duration in human readable format."""
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m{secs:02d}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h{minutes:02d}m"
+        # Quantized to the displayed precision so repeated values hit the cache
+        return _format_duration(round(seconds, 1))
 
-    def _format_bytes(self, bytes_count: float) -> str:
+    @staticmethod
+    def _format_bytes(bytes_count: float) -> str:
         """Format bytes in human readable format."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes_count < 1024.0:
-                return f"{bytes_count:.1f}{unit}"
-            bytes_count /= 1024.0
-        return f"{bytes_count:.1f}PB"
+        return _format_bytes(round(bytes_count))
 
     def save_checkpoint(self, checkpoint_path: Path, extra_data: dict = None):
-        """Save progress checkpoint for resume capability."""
+        """
+        Save progress checkpoint for resume capability.
+
+        The checkpoint is written to a temporary file and renamed over the
+        old one, so a crash never leaves a partial checkpoint behind. Saving
+        is skipped when neither the counters nor extra_data have changed
+        since the last checkpoint written to the same path.
+        """
         try:
+            extra_data = extra_data or {}
+            state = (checkpoint_path, tuple(self._totals()))
+            if self._last_checkpoint == (state, extra_data):
+                return
+
             stats = self.get_stats()
             checkpoint_data = {
                 "stats": stats,
                 "checkpoint_time": datetime.now().isoformat(),
-                "extra_data": extra_data or {},
+                "extra_data": extra_data,
             }
 
-            with open(checkpoint_path, "w") as f:
-                json.dump(checkpoint_data, f, indent=2)
+            # Checkpoints are machine-read, so they are written compact
+            tmp_path = Path(f"{checkpoint_path}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(fastjson.dumps(checkpoint_data, indent=False))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, checkpoint_path)
 
             self.checkpoint_file = checkpoint_path
+            self._last_checkpoint = (state, dict(extra_data))
 
         except Exception as e:
             print(f"Warning: Could not save checkpoint: {e}")
@@ -240,6 +371,78 @@ class ProgressTracker:
             )
 
 
+class BatchedProgress:
+    """
+    Accumulate progress updates locally and apply them to a tracker in batches.
+
+    Drop-in for ``ProgressTracker.update`` in hot per-chunk loops: the
+    tracker is updated once every ``FLUSH_EVERY`` updates or once
+    ``FLUSH_BYTES`` have accumulated, instead of on every chunk. Call
+    ``flush()`` (or use it as a context manager) when the loop ends.
+    """
+
+    FLUSH_EVERY = 16  # power of two, tested with a mask
+    FLUSH_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, tracker: ProgressTracker):
+        """
+        Initialize batched updater.
+
+        Args:
+            tracker: Tracker that receives the accumulated counts
+        """
+        self.tracker = tracker
+        self.calls = 0
+        self._reset()
+
+    def _reset(self):
+        self.processed = 0
+        self.entities = 0
+        self.controlled = 0
+        self.noncontrolled = 0
+        self.bytes_count = 0
+
+    def update(
+        self,
+        processed: int = 1,
+        entities: int = 0,
+        controlled: int = 0,
+        noncontrolled: int = 0,
+        bytes_count: int = 0,
+    ):
+        """Accumulate counters; same arguments as ``ProgressTracker.update``."""
+        self.processed += processed
+        self.entities += entities
+        self.controlled += controlled
+        self.noncontrolled += noncontrolled
+        self.bytes_count += bytes_count
+        self.calls += 1
+
+        if (
+            self.calls & (self.FLUSH_EVERY - 1) == 0
+            or self.bytes_count >= self.FLUSH_BYTES
+        ):
+            self.flush()
+
+    def flush(self):
+        """Apply any pending counts to the tracker."""
+        if self.processed or self.entities or self.bytes_count:
+            self.tracker.update(
+                processed=self.processed,
+                entities=self.entities,
+                controlled=self.controlled,
+                noncontrolled=self.noncontrolled,
+                bytes_count=self.bytes_count,
+            )
+            self._reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+
 class ProgressMonitor:
     """Background progress monitor with periodic updates."""
 
@@ -254,14 +457,21 @@ class ProgressMonitor:
         self.tracker = tracker
         self.update_interval = update_interval
         self.monitor_thread = None
+        self.render_thread = None
         self.stop_event = threading.Event()
 
+        # Single-slot mailbox from the sampler to the renderer; a sample the
+        # renderer hasn't picked up yet is replaced by the newer one
+        self._samples = queue.Queue(maxsize=1)
+
     def start(self):
         """Start background monitoring."""
         if self.monitor_thread and self.monitor_thread.is_alive():
             return
 
         self.stop_event.clear()
+        self.render_thread = threading.Thread(target=self._render_loop, daemon=True)
+        self.render_thread.start()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
 
@@ -270,11 +480,37 @@ class ProgressMonitor:
         self.stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2.0)
+        if self.render_thread:
+            self.render_thread.join(timeout=2.0)
+
+    def _publish(self, stats: dict[str, Any]):
+        """Hand a sample to the renderer, dropping any stale unrendered one."""
+        while True:
+            try:
+                self._samples.put_nowait(stats)
+                return
+            except queue.Full:
+                try:
+                    self._samples.get_nowait()
+                except queue.Empty:
+                    pass
 
     def _monitor_loop(self):
-        """Background monitoring loop."""
+        """Background sampling loop; never blocks on terminal output."""
+        # Every update moves last_update, so an unchanged value means there
+        # is nothing new to draw
+        rendered_update = None
         while not self.stop_event.wait(self.update_interval):
-            self.tracker.print_progress()
-
-        # Final update
-        self.tracker.print_progress()
+            last_update = self.tracker.last_update
+            if last_update != rendered_update:
+                rendered_update = last_update
+                self._publish(self.tracker.get_stats())
+
+        # Final update, then tell the renderer to finish
+        self._publish(self.tracker.get_stats())
+        self._samples.put(None)
+
+    def _render_loop(self):
+        """Print the latest sample whenever one arrives."""
+        while (stats := self._samples.get()) is not None:
+            self.tracker.print_progress(stats=stats)
@@ -3,13 +3,35 @@ Results Explorer - Interactive PII results browser and exporter.
 """
 
 import argparse
+import ast
 import csv
-import json
+import os
 import sys
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import fastjson
+
+# Entity types that drive the severity column
+CRITICAL_TYPES = frozenset({"ID", "CREDIT_CARD", "BANK_ROUTING", "DRIVER_LICENSE"})
+MEDIUM_TYPES = frozenset({"PHONE_NUMBER", "EIN", "ZIP", "ADDRESS"})
+
+# Severity names by rank, and the rank of each type above LOW (1)
+SEVERITY_NAMES = ("NONE", "LOW", "MEDIUM", "CRITICAL")
+_CRITICAL_RANK = 3
+_TYPE_RANKS = {
+    **dict.fromkeys(MEDIUM_TYPES, 2),
+    **dict.fromkeys(CRITICAL_TYPES, _CRITICAL_RANK),
+}
+
+# Files listed per page by the interactive explorer
+PAGE_SIZE = 25
+
+# Numeric summary.csv columns, converted to int once when loaded
+INT_FIELDS = ("controlled", "noncontrolled", "total", "size_bytes")
+
 
 def find_output_directories(start_path: Path = None) -> list[Path]:
     """
@@ -24,15 +46,52 @@ def find_output_directories(start_path: Path = None) -> list[Path]:
     if start_path is None:
         start_path = Path.cwd()
 
-    output_dirs = []
-
-    # Search for summary.csv files
-    for summary_file in start_path.rglob("summary.csv"):
-        output_dir = summary_file.parent
-        if output_dir not in output_dirs:
-            output_dirs.append(output_dir)
-
-    return sorted(output_dirs)
+    output_dirs = set()
+
+    # Walk the tree with scandir, whose entries carry their file type, so
+    # no extra stat call is needed per entry
+    pending = [os.fspath(start_path)]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name == "summary.csv" and entry.is_file():
+                        output_dirs.add(directory)
+                except OSError:
+                    continue
+
+    return sorted(Path(output_dir) for output_dir in output_dirs)
+
+
+def _parse_top_types(top_types_str: str) -> dict[str, int]:
+    """Parse a top_types string like '{"ID": 2, "EMAIL_ADDRESS": 1}'."""
+    if not top_types_str or top_types_str == "{}":
+        return {}
+
+    # The CSV stores top_types as JSON; older summaries hold the dict's
+    # Python repr, so fall back to parsing it as a literal
+    try:
+        top_types = fastjson.loads(top_types_str)
+    except ValueError:
+        try:
+            top_types = ast.literal_eval(top_types_str)
+        except (ValueError, SyntaxError):
+            return {}
+    return top_types if isinstance(top_types, dict) else {}
+
+
+def _read_summary_rows(summary_path: Path) -> list[dict[str, str]]:
+    """Read summary.csv into one dict per row, with every value as a string."""
+    with open(summary_path, encoding="utf-8") as f:
+        return list(csv.DictReader(f))
 
 
 def load_summary_data(out_dir: Path) -> list[dict[str, Any]]:
@@ -41,33 +100,17 @@ def load_summary_data(out_dir: Path) -> list[dict[str, Any]]:
     if not summary_path.exists():
         return []
 
-    data = []
-    with open(summary_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Parse top_types string
-            top_types_str = row.get("top_types", "{}")
+    data = _read_summary_rows(summary_path)
+    for row in data:
+        # Parse top_types string
+        row["top_types_parsed"] = _parse_top_types(row.get("top_types", "{}"))
+
+        # Convert count columns once so readers can use them directly
+        for field in INT_FIELDS:
             try:
-                # Simple parsing for Python dict string
-                top_types = {}
-                if top_types_str != "{}":
-                    clean_str = top_types_str.strip("{}").replace("'", '"')
-                    parts = clean_str.split(",")
-                    for part in parts:
-                        part = part.strip()
-                        if ":" in part:
-                            colon_pos = part.find(":")
-                            key = part[:colon_pos].strip().strip('"')
-                            value_str = part[colon_pos + 1 :].strip()
-                            try:
-                                top_types[key] = int(value_str)
-                            except ValueError:
-                                continue
-                row["top_types_parsed"] = top_types
-            except:
-                row["top_types_parsed"] = {}
-
-            data.append(row)
+                row[field] = int(row.get(field) or 0)
+            except (TypeError, ValueError):
+                row[field] = 0
 
     return data
 
@@ -77,15 +120,17 @@ def get_severity(top_types: dict[str, int]) -> str:
     if not top_types:
         return "NONE"
 
-    critical_types = {"ID", "CREDIT_CARD", "BANK_ROUTING", "DRIVER_LICENSE"}
-    if any(entity_type in critical_types for entity_type in top_types):
-        return "CRITICAL"
-
-    medium_types = {"PHONE_NUMBER", "EIN", "ZIP", "ADDRESS"}
-    if any(entity_type in medium_types for entity_type in top_types):
-        return "MEDIUM"
+    # Highest rank among the types present, stopping at the first critical one
+    rank = 1
+    get_rank = _TYPE_RANKS.get
+    for entity_type in top_types:
+        type_rank = get_rank(entity_type, 1)
+        if type_rank > rank:
+            rank = type_rank
+            if rank == _CRITICAL_RANK:
+                break
 
-    return "LOW"
+    return SEVERITY_NAMES[rank]
 
 
 def export_to_csv(data: list[dict[str, Any]], output_path: Path):
@@ -128,53 +173,90 @@ def export_to_csv(data: list[dict[str, Any]], output_path: Path):
             )
 
 
+def _enhanced_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Build the JSON export record for one summary row."""
+    top_types = row.get("top_types_parsed", {})
+    severity = get_severity(top_types)
+    filename = Path(row.get("file", "")).name
+
+    return {
+        "file_path": row.get("file", ""),
+        "filename": filename,
+        "severity": severity,
+        "controlled_count": row.get("controlled", 0),
+        "noncontrolled_count": row.get("noncontrolled", 0),
+        "total_count": row.get("total", 0),
+        "file_size_bytes": row.get("size_bytes", 0),
+        "modified_date": row.get("modified", ""),
+        "top_entity_types": top_types,
+        "hash16": row.get("hash16", ""),
+        "scan_started": row.get("scan_started", ""),
+        "scan_ended": row.get("scan_ended", ""),
+    }
+
+
 def export_to_json(data: list[dict[str, Any]], output_path: Path):
-    """Export summary data to JSON with enhanced formatting."""
-    enhanced_data = []
+    """
+    Export summary data to JSON with enhanced formatting.
 
-    for row in data:
-        top_types = row.get("top_types_parsed", {})
-        severity = get_severity(top_types)
-        filename = Path(row.get("file", "")).name
+    Records are encoded and written one row at a time, so the enhanced
+    records are never all held in memory at once.
+    """
+    with open(output_path, "wb") as f:
+        f.write(b"[")
+        for i, row in enumerate(data):
+            # Indent each record one level, as json.dump(indent=2) would
+            record = fastjson.dumps(_enhanced_row(row), indent=True)
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(record.replace(b"\n", b"\n  "))
+        f.write(b"\n]" if data else b"]")
 
-        enhanced_row = {
-            "file_path": row.get("file", ""),
-            "filename": filename,
-            "severity": severity,
-            "controlled_count": int(row.get("controlled", 0)),
-            "noncontrolled_count": int(row.get("noncontrolled", 0)),
-            "total_count": int(row.get("total", 0)),
-            "file_size_bytes": int(row.get("size_bytes", 0)),
-            "modified_date": row.get("modified", ""),
-            "top_entity_types": top_types,
-            "hash16": row.get("hash16", ""),
-            "scan_started": row.get("scan_started", ""),
-            "scan_ended": row.get("scan_ended", ""),
-        }
-        enhanced_data.append(enhanced_row)
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(enhanced_data, f, indent=2)
-
-
-def print_summary_stats(data: list[dict[str, Any]]):
-    """Print summary statistics."""
-    if not data:
-        print("No data available.")
-        return
 
-    total_files = len(data)
-    files_with_pii = sum(1 for row in data if int(row.get("total", 0)) > 0)
-    total_controlled = sum(int(row.get("controlled", 0)) for row in data)
-    total_noncontrolled = sum(int(row.get("noncontrolled", 0)) for row in data)
-    total_entities = total_controlled + total_noncontrolled
+def summarize_data(data: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Compute summary statistics in a single pass over the rows.
 
-    # Severity breakdown
+    Each row's severity is computed once and stored on the row as
+    ``"_severity"``; rows with PII are collected in ``"pii_rows"``.
+    """
+    controlled = 0
+    noncontrolled = 0
     severity_counts = {"CRITICAL": 0, "MEDIUM": 0, "LOW": 0, "NONE": 0}
+    pii_rows = []
+
     for row in data:
-        top_types = row.get("top_types_parsed", {})
-        severity = get_severity(top_types)
+        controlled += row.get("controlled", 0)
+        noncontrolled += row.get("noncontrolled", 0)
+        severity = row["_severity"] = get_severity(row.get("top_types_parsed", {}))
         severity_counts[severity] += 1
+        if row.get("total", 0) > 0:
+            pii_rows.append(row)
+
+    return {
+        "total_files": len(data),
+        "controlled": controlled,
+        "noncontrolled": noncontrolled,
+        "severity_counts": severity_counts,
+        "pii_rows": pii_rows,
+    }
+
+
+def print_summary_stats(
+    data: list[dict[str, Any]], stats: dict[str, Any] | None = None
+):
+    """Print summary statistics, from ``summarize_data`` output if given."""
+    if not data:
+        print("No data available.")
+        return
+
+    if stats is None:
+        stats = summarize_data(data)
+    total_files = stats["total_files"]
+    files_with_pii = len(stats["pii_rows"])
+    total_controlled = stats["controlled"]
+    total_noncontrolled = stats["noncontrolled"]
+    total_entities = total_controlled + total_noncontrolled
+    severity_counts = stats["severity_counts"]
 
     print("\n📊 Summary Statistics:")
     print(f"  Total files scanned: {total_files}")
@@ -189,6 +271,45 @@ def print_summary_stats(data: list[dict[str, Any]]):
     print(f"    NONE: {severity_counts['NONE']} files")
 
 
+def _iter_file_entries(rows: list[dict[str, Any]]) -> Iterator[str]:
+    """Yield the listing entry of each file with PII, formatted on demand."""
+    for i, row in enumerate(rows, 1):
+        filename = Path(row.get("file", "")).name
+        total = row.get("total", 0)
+        controlled = row.get("controlled", 0)
+        noncontrolled = row.get("noncontrolled", 0)
+        top_types = row.get("top_types_parsed", {})
+        severity = row["_severity"]
+
+        yield (
+            f"{i:2d}. {filename}\n"
+            f"     Severity: {severity} | Entities: {total} ({controlled} Controlled, {noncontrolled} NonControlled)\n"
+            f"     Types: {', '.join(top_types.keys()) if top_types else 'None'}\n"
+        )
+
+
+def page_output(entries: Iterable[str], page_size: int = PAGE_SIZE):
+    """
+    Print entries a page at a time when attached to a terminal.
+
+    Between pages the user presses Enter to continue or q to skip the rest,
+    so entries past the last page shown are never formatted. Without a
+    terminal everything is printed.
+
+    Args:
+        entries: Text entries to print, each followed by a blank line
+        page_size: Number of entries per page
+    """
+    interactive = sys.stdin.isatty() and sys.stdout.isatty()
+    for shown, entry in enumerate(entries):
+        # Only ask once there is another entry to show
+        if interactive and shown and shown % page_size == 0:
+            answer = input("-- More: Enter to continue, q to stop -- ")
+            if answer.strip().lower() == "q":
+                break
+        print(entry)
+
+
 def interactive_explorer(out_dir: Path):
     """Interactive results explorer."""
     print("\n🔍 PII Results Explorer")
@@ -201,29 +322,17 @@ def interactive_explorer(out_dir: Path):
         print("❌ No scan data found in this directory.")
         return
 
-    print_summary_stats(data)
+    stats = summarize_data(data)
+    print_summary_stats(data, stats)
 
     # Show files with PII
-    files_with_pii = [row for row in data if int(row.get("total", 0)) > 0]
+    files_with_pii = stats["pii_rows"]
 
     if files_with_pii:
         print(f"\n📋 Files with PII ({len(files_with_pii)}):")
         print("-" * 80)
 
-        for i, row in enumerate(files_with_pii, 1):
-            filename = Path(row.get("file", "")).name
-            total = int(row.get("total", 0))
-            controlled = int(row.get("controlled", 0))
-            noncontrolled = int(row.get("noncontrolled", 0))
-            top_types = row.get("top_types_parsed", {})
-            severity = get_severity(top_types)
-
-            print(f"{i:2d}. {filename}")
-            print(
-                f"     Severity: {severity} | Entities: {total} ({controlled} Controlled, {noncontrolled} NonControlled)"
-            )
-            print(f"     Types: {', '.join(top_types.keys()) if top_types else 'None'}")
-            print()
+        page_output(_iter_file_entries(files_with_pii))
 
     # Export options
     print("\n💾 Export Options:")
@@ -306,7 +415,7 @@ Examples:
             for i, out_dir in enumerate(output_dirs, 1):
                 data = load_summary_data(out_dir)
                 files_count = len(data)
-                pii_files = sum(1 for row in data if int(row.get("total", 0)) > 0)
+                pii_files = sum(1 for row in data if row.get("total", 0) > 0)
                 print(f"{i}. {out_dir} ({files_count} files, {pii_files} with PII)")
         else:
             print("No output directories found.")
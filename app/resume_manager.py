@@ -7,10 +7,38 @@ import fcntl
 import hashlib
 import json
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+from . import fastjson
+
+# Most file fingerprints remembered per ResumeManager
+FINGERPRINT_CACHE_SIZE = 4096
+
+# Checkpoints older than this are considered stale
+CHECKPOINT_MAX_AGE_SECONDS = 24 * 3600
+
+# Threads reading checkpoint files concurrently (hides network FS latency)
+CHECKPOINT_READ_THREADS = 16
+
+_save_time = itemgetter("save_time")
+
+
+def _digest16(data: str) -> str:
+    """Hash a string to 16 hex characters (an 8-byte BLAKE2b digest)."""
+    return hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+
+
+def _read_checkpoint(path: str) -> Any:
+    """Read and parse one checkpoint file."""
+    with open(path, "rb") as f:
+        return fastjson.loads(f.read())
+
 
 class ResumeManager:
     """Smart resume manager that automatically handles scan interruptions."""
@@ -30,6 +58,9 @@ class ResumeManager:
         self.lock_file = self.resume_dir / "scan.lock"
         self.lock_fd = None
 
+        # Fingerprints keyed by (path, size, mtime_ns), least recent first
+        self._fingerprints = OrderedDict()
+
     def acquire_lock(self, operation_id: str) -> bool:
         """
         Acquire exclusive lock for scanning operation.
@@ -41,8 +72,12 @@ class ResumeManager:
             True if lock acquired, False if another scan is running
         """
         try:
-            self.lock_fd = open(self.lock_file, "w")
-            fcntl.flock(self.lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # Open without truncating; a caller that loses the flock below
+            # must not wipe the running operation's info
+            fd = os.open(self.lock_file, os.O_WRONLY | os.O_CREAT, 0o644)
+            self.lock_fd = os.fdopen(fd, "wb")
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            os.ftruncate(fd, 0)
 
             # Write operation info to lock file
             lock_info = {
@@ -52,7 +87,7 @@ class ResumeManager:
                 "hostname": os.uname().nodename if hasattr(os, "uname") else "unknown",
             }
 
-            json.dump(lock_info, self.lock_fd, indent=2)
+            self.lock_fd.write(fastjson.dumps(lock_info))
             self.lock_fd.flush()
 
             return True
@@ -75,31 +110,55 @@ class ResumeManager:
             finally:
                 self.lock_fd = None
 
-    def get_file_fingerprint(self, file_path: Path) -> str:
+    def get_file_fingerprint(
+        self, file_path: Path, stat: os.stat_result | None = None
+    ) -> str:
         """
         Generate unique fingerprint for file based on path, size, and mtime.
 
         Args:
             file_path: Path to file
+            stat: Stat result of file_path, if the caller already has one
 
         Returns:
             Unique fingerprint string
         """
-        try:
-            stat = file_path.stat()
-            fingerprint_data = f"{file_path}:{stat.st_size}:{stat.st_mtime}"
-            return hashlib.md5(fingerprint_data.encode()).hexdigest()[:16]
-        except (OSError, FileNotFoundError):
-            # Fallback to path-based fingerprint
-            return hashlib.md5(str(file_path).encode()).hexdigest()[:16]
-
-    def save_checkpoint(self, file_path: Path, progress_data: dict[str, Any]) -> Path:
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except (OSError, FileNotFoundError):
+                # Fallback to path-based fingerprint
+                return _digest16(str(file_path))
+
+        # Reuse the hash while the file's size and mtime are unchanged
+        key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+        fingerprint = self._fingerprints.get(key)
+        if fingerprint is not None:
+            self._fingerprints.move_to_end(key)
+            return fingerprint
+
+        fingerprint_data = f"{file_path}:{stat.st_size}:{stat.st_mtime}"
+        fingerprint = _digest16(fingerprint_data)
+        self._fingerprints[key] = fingerprint
+        if len(self._fingerprints) > FINGERPRINT_CACHE_SIZE:
+            self._fingerprints.popitem(last=False)
+        return fingerprint
+
+    def save_checkpoint(
+        self, file_path: Path, progress_data: dict[str, Any], fast: bool = False
+    ) -> Path:
         """
         Save progress checkpoint for file.
 
+        The checkpoint is written to a new temporary file, synced and
+        verified, then renamed over the previous checkpoint and the rename
+        synced, so a crash leaves either the old or the new checkpoint intact.
+
         Args:
             file_path: File being processed
             progress_data: Current progress information
+            fast: Skip the syncs and verification, for frequent in-flight
+                saves where losing the latest checkpoint is acceptable
 
         Returns:
             Path to checkpoint file
@@ -107,21 +166,50 @@ class ResumeManager:
         fingerprint = self.get_file_fingerprint(file_path)
         checkpoint_file = self.resume_dir / f"checkpoint_{fingerprint}.json"
 
+        now = time.time()
         checkpoint_data = {
             "file_path": str(file_path),
             "fingerprint": fingerprint,
-            "save_time": datetime.now().isoformat(),
+            "save_time": datetime.fromtimestamp(now).isoformat(),
+            "save_ts": now,
             "progress": progress_data,
             "version": "1.0",
         }
 
         try:
-            # Atomic write using temporary file
+            # Atomic write using temporary file; checkpoints are machine-read,
+            # so they are written compact
+            data = fastjson.dumps(checkpoint_data, indent=False)
             temp_file = checkpoint_file.with_suffix(".tmp")
-            with open(temp_file, "w") as f:
-                json.dump(checkpoint_data, f, indent=2)
+            temp_file.unlink(missing_ok=True)  # Left over from a crashed save
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                    if not fast:
+                        f.flush()
+                        os.fsync(f.fileno())
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
+
+            if not fast:
+                # Check what was written before it replaces a good checkpoint
+                with open(temp_file, "rb") as f:
+                    if f.read() != data:
+                        temp_file.unlink(missing_ok=True)
+                        raise OSError(f"verification failed for {temp_file}")
 
             temp_file.replace(checkpoint_file)
+
+            if not fast:
+                # Persist the rename itself
+                dir_fd = os.open(self.resume_dir, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+
             return checkpoint_file
 
         except Exception as e:
@@ -145,11 +233,11 @@ class ResumeManager:
             return None
 
         try:
-            with open(checkpoint_file) as f:
-                checkpoint_data = json.load(f)
+            with open(checkpoint_file, "rb") as f:
+                checkpoint_data = fastjson.loads(f.read())
 
             # Validate checkpoint
-            if self._is_checkpoint_valid(checkpoint_data, file_path):
+            if self._is_checkpoint_valid(checkpoint_data, file_path, fingerprint):
                 return checkpoint_data
             else:
                 # Invalid checkpoint, remove it
@@ -162,13 +250,16 @@ class ResumeManager:
             checkpoint_file.unlink(missing_ok=True)
             return None
 
-    def _is_checkpoint_valid(self, checkpoint_data: dict, file_path: Path) -> bool:
+    def _is_checkpoint_valid(
+        self, checkpoint_data: dict, file_path: Path, fingerprint: str | None = None
+    ) -> bool:
         """
         Validate checkpoint data against current file state.
 
         Args:
             checkpoint_data: Loaded checkpoint data
             file_path: Current file path
+            fingerprint: Current fingerprint of file_path, if already known
 
         Returns:
             True if checkpoint is valid for current file state
@@ -179,21 +270,23 @@ class ResumeManager:
                 return False
 
             # Check if fingerprint matches (file unchanged)
-            current_fingerprint = self.get_file_fingerprint(file_path)
-            if checkpoint_data.get("fingerprint") != current_fingerprint:
+            if fingerprint is None:
+                fingerprint = self.get_file_fingerprint(file_path)
+            if checkpoint_data.get("fingerprint") != fingerprint:
                 return False
 
             # Check if checkpoint is not too old (optional)
-            save_time_str = checkpoint_data.get("save_time", "")
-            if save_time_str:
-                save_time = datetime.fromisoformat(save_time_str)
-                age_hours = (datetime.now() - save_time).total_seconds() / 3600
-
-                # Consider checkpoint stale after 24 hours
-                if age_hours > 24:
-                    return False
-
-            return True
+            save_ts = checkpoint_data.get("save_ts")
+            if save_ts is None:
+                # Checkpoints written before save_ts only carry the ISO string
+                save_time_str = checkpoint_data.get("save_time", "")
+                if save_time_str:
+                    save_ts = datetime.fromisoformat(save_time_str).timestamp()
+
+            # Consider checkpoint stale after 24 hours
+            return (
+                save_ts is None or time.time() - save_ts <= CHECKPOINT_MAX_AGE_SECONDS
+            )
 
         except (OSError, json.JSONDecodeError, KeyError):
             return False
@@ -218,37 +311,59 @@ class ResumeManager:
         """
         pending = []
 
-        for checkpoint_file in self.resume_dir.glob("checkpoint_*.json"):
-            try:
-                with open(checkpoint_file) as f:
-                    checkpoint_data = json.load(f)
-
-                file_path = Path(checkpoint_data.get("file_path", ""))
-
-                # Check if file still exists and checkpoint is valid
-                if file_path.exists() and self._is_checkpoint_valid(
-                    checkpoint_data, file_path
-                ):
-                    pending.append(
-                        {
-                            "file_path": str(file_path),
-                            "fingerprint": checkpoint_data.get("fingerprint"),
-                            "save_time": checkpoint_data.get("save_time"),
-                            "progress": checkpoint_data.get("progress", {}),
-                            "checkpoint_file": str(checkpoint_file),
-                        }
-                    )
-                else:
-                    # Clean up invalid checkpoints
-                    checkpoint_file.unlink(missing_ok=True)
-
-            except Exception as e:
-                print(f"Warning: Could not read checkpoint {checkpoint_file}: {e}")
-                # Clean up corrupted checkpoint
-                checkpoint_file.unlink(missing_ok=True)
+        with os.scandir(self.resume_dir) as entries:
+            checkpoint_files = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith("checkpoint_") and entry.name.endswith(".json")
+            ]
+        if not checkpoint_files:
+            return pending
+
+        # Reads are I/O bound, so overlap them on threads; validation stays
+        # here since it touches the fingerprint cache
+        workers = min(CHECKPOINT_READ_THREADS, len(checkpoint_files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            reads = [pool.submit(_read_checkpoint, p) for p in checkpoint_files]
+
+            for checkpoint_file, read in zip(checkpoint_files, reads):
+                try:
+                    checkpoint_data = read.result()
+                    file_path = Path(checkpoint_data.get("file_path", ""))
+
+                    # Stat the file once: a missing file invalidates the
+                    # checkpoint, otherwise the stat feeds the fingerprint
+                    try:
+                        stat = file_path.stat()
+                    except OSError:
+                        valid = False
+                    else:
+                        fingerprint = self.get_file_fingerprint(file_path, stat)
+                        valid = self._is_checkpoint_valid(
+                            checkpoint_data, file_path, fingerprint
+                        )
+
+                    if valid:
+                        pending.append(
+                            {
+                                "file_path": str(file_path),
+                                "fingerprint": checkpoint_data.get("fingerprint"),
+                                "save_time": checkpoint_data.get("save_time", ""),
+                                "progress": checkpoint_data.get("progress", {}),
+                                "checkpoint_file": checkpoint_file,
+                            }
+                        )
+                    else:
+                        # Clean up invalid checkpoints
+                        Path(checkpoint_file).unlink(missing_ok=True)
+
+                except Exception as e:
+                    print(f"Warning: Could not read checkpoint {checkpoint_file}: {e}")
+                    # Clean up corrupted checkpoint
+                    Path(checkpoint_file).unlink(missing_ok=True)
 
         # Sort by save time (newest first)
-        pending.sort(key=lambda x: x.get("save_time", ""), reverse=True)
+        pending.sort(key=_save_time, reverse=True)
         return pending
 
     def cleanup_old_checkpoints(self, max_age_hours: int = 48):
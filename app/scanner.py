@@ -3,15 +3,36 @@ Scanner functionality with file watching and CSV output.
 """
 
 import csv
+import multiprocessing as mp
 import os
+import queue
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    ProcessPoolExecutor,
+    wait,
+)
 from datetime import datetime
 from pathlib import Path
 from threading import Thread, Event
 
+from . import fastjson
 from .dedupe import DedupeManager
+from .parallel_scanner import _init_worker
 from .pipeline import scan_file_once
+from config import MAX_WORKERS
 from ingest import SkippedEncryptedPDF
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - depends on environment
+    FileSystemEventHandler = object
+    Observer = None
+
+# Summary rows buffered before the CSV file is flushed
+CSV_FLUSH_ROWS = 32
+
 
 class WatcherHandle:
     """Handle for controlling a file watcher thread.
@@ -25,9 +46,13 @@ class WatcherHandle:
         The background thread performing file watching.
     stop_event : Event
         Threading event used to signal the watcher to stop.
+    scanner : FileScanner or None
+        Scanner driven by the thread, closed once the thread has stopped.
     """
 
-    def __init__(self, thread: Thread, stop_event: Event):
+    def __init__(
+        self, thread: Thread, stop_event: Event, scanner: "FileScanner | None" = None
+    ):
         """Initialize the watcher handle.
 
         Parameters
@@ -36,9 +61,12 @@ class WatcherHandle:
             The thread running the file watcher.
         stop_event : Event
             Event object for signaling stop.
+        scanner : FileScanner, optional
+            Scanner used by the thread; its summary file is closed on stop.
         """
         self.thread = thread
         self.stop_event = stop_event
+        self.scanner = scanner
 
     def stop(self):
         """Stop the watcher thread gracefully.
@@ -48,6 +76,8 @@ class WatcherHandle:
         """
         self.stop_event.set()
         self.thread.join()
+        if self.scanner is not None:
+            self.scanner.close()
 
     def is_running(self) -> bool:
         """Check if the watcher is currently running.
@@ -60,6 +90,40 @@ class WatcherHandle:
         return self.thread.is_alive() and not self.stop_event.is_set()
 
 
+class _ChangeQueueHandler(FileSystemEventHandler):
+    """Watchdog event handler queueing created, modified and moved-in files.
+
+    Parameters
+    ----------
+    changes : queue.Queue
+        Queue receiving the paths of changed files.
+    exts : Set[str]
+        Lowercase file extensions to watch; other files are ignored.
+    """
+
+    def __init__(self, changes: queue.Queue, exts: set[str]):
+        super().__init__()
+        self.changes = changes
+        self.exts = exts
+
+    def _enqueue(self, path: str):
+        file_path = Path(os.fsdecode(path))
+        if file_path.suffix.lower() in self.exts:
+            self.changes.put(file_path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._enqueue(event.dest_path)
+
+
 class FileScanner:
     """File scanner for PII detection with deduplication and CSV output.
 
@@ -75,9 +139,17 @@ class FileScanner:
         Set of file extensions to scan (e.g., {'.txt', '.csv'}).
     dedupe : DedupeManager
         Manager for handling file deduplication to avoid re-scanning.
+    max_workers : int
+        Number of worker processes scanning files in parallel; 1 scans
+        files one at a time in this process.
     """
 
-    def __init__(self, out_dir: Path, exts: set[str] | None = None):
+    def __init__(
+        self,
+        out_dir: Path,
+        exts: set[str] | None = None,
+        max_workers: int | None = None,
+    ):
         """Initialize the file scanner.
 
         Parameters
@@ -87,6 +159,9 @@ class FileScanner:
         exts : Set[str], optional
             Set of supported file extensions. If None, defaults to common
             text formats (.txt, .csv, .log, .md, .html, .pdf).
+        max_workers : int, optional
+            Worker processes for directory scans (default: config.MAX_WORKERS,
+            which is capped by available memory).
 
         Notes
         -----
@@ -96,6 +171,8 @@ class FileScanner:
         self.out_dir = out_dir
         self.exts = exts or {".txt", ".csv", ".log", ".md", ".html", ".pdf"}
         self.dedupe = DedupeManager(out_dir)
+        self.max_workers = max_workers or MAX_WORKERS
+        self._pool = None
 
         # Ensure output directory exists
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -107,6 +184,78 @@ class FileScanner:
         if not self.csv_path.exists():
             self._init_csv()
 
+        # Summary file, opened on the first row and kept open between rows
+        self._csv_file = None
+        self._csv_writer = None
+        self._csv_pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _write_summary_row(self, row: list):
+        """Append a row to the CSV summary, flushing every CSV_FLUSH_ROWS rows.
+
+        Parameters
+        ----------
+        row : list
+            Values of the summary columns.
+        """
+        if self._csv_file is None:
+            # Kept open across files and closed in close()
+            self._csv_file = open(  # noqa: SIM115
+                self.csv_path, "a", newline="", encoding="utf-8", buffering=1 << 16
+            )
+            self._csv_writer = csv.writer(self._csv_file)
+
+        self._csv_writer.writerow(row)
+        self._csv_pending += 1
+        if self._csv_pending >= CSV_FLUSH_ROWS:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered summary rows to disk."""
+        if self._csv_file is not None and self._csv_pending:
+            self._csv_file.flush()
+            self._csv_pending = 0
+
+    def close(self):
+        """Shut down the worker pool and close the dedupe journal and CSV summary.
+
+        The scanner stays usable; the pool is restarted and the files reopened
+        when next needed.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.dedupe.close()
+        if self._csv_file is not None:
+            self.flush()
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the persistent worker pool, starting it on first use."""
+        if self._pool is None:
+            # forkserver avoids forking a possibly large parent process
+            methods = mp.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else None
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp.get_context(method),
+                initializer=_init_worker,
+            )
+        return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """Shut down a broken worker pool so the next use starts a fresh one."""
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
     def _init_csv(self):
         """Initialize CSV summary file with header row.
 
@@ -131,7 +280,11 @@ class FileScanner:
             )
 
     def _scan_one(
-        self, file_path: Path, chunk_size: int = 2000, overlap: int = 100
+        self,
+        file_path: Path,
+        chunk_size: int = 2000,
+        overlap: int = 100,
+        stat: os.stat_result | None = None,
     ) -> bool:
         """Scan a single file for PII entities.
 
@@ -146,6 +299,9 @@ class FileScanner:
             Size of text chunks for processing (default: 2000 chars).
         overlap : int, optional
             Character overlap between chunks to catch boundary entities (default: 100).
+        stat : os.stat_result, optional
+            Stat result of the file, if the caller already has one. It is
+            reused for deduplication, the summary row and the file's keys.
 
         Returns
         -------
@@ -159,58 +315,15 @@ class FileScanner:
         JSONL entity files and the CSV summary.
         """
         try:
-            # Check if file should be skipped
-            if self.dedupe.is_duplicate(file_path):
+            job = self._prepare(file_path, stat)
+            if job is None:
                 return False
 
-            # Get file info
-            stat = file_path.stat()
-            size_bytes = stat.st_size
-            modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            hash16 = self.dedupe.get_hash16(file_path)
-
-            # Generate output paths
-            entities_path = self.out_dir / f"entities-{hash16}.jsonl"
-
             # Scan file
-            scan_started = datetime.now().isoformat()
-            summary = scan_file_once(
-                path=file_path,
-                exts=self.exts,
-                out_jsonl=entities_path,
-                chunk_size=chunk_size,
-                overlap=overlap,
-            )
-            scan_ended = datetime.now().isoformat()
-
-            # Write CSV row
-            with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        str(file_path),
-                        hash16,
-                        size_bytes,
-                        modified,
-                        summary.controlled,
-                        summary.noncontrolled,
-                        summary.total,
-                        str(summary.top_types),
-                        scan_started,
-                        scan_ended,
-                    ]
-                )
-
-            # Mark as processed
-            canonical_key = self.dedupe._get_canonical_key(file_path)
-            self.dedupe.add_processed(file_path, canonical_key)
-
-            # Print counts to stderr
-            print(
-                f"Processed: {file_path.name} - {summary.total} entities ({summary.controlled} controlled, {summary.noncontrolled} noncontrolled)",
-                file=os.sys.stderr,
+            summary, scan_started, scan_ended = _scan_file_worker(
+                file_path, self.exts, job[0], chunk_size, overlap
             )
-
+            self._record(file_path, job, summary, scan_started, scan_ended)
             return True
 
         except SkippedEncryptedPDF:
@@ -220,6 +333,88 @@ class FileScanner:
             print(f"Error processing {file_path}: {e}", file=os.sys.stderr)
             return False
 
+    def _prepare(self, file_path: Path, stat: os.stat_result | None = None):
+        """Collect what is needed to scan and record a file.
+
+        Parameters
+        ----------
+        file_path : Path
+            Path to the file to scan.
+        stat : os.stat_result, optional
+            Stat result of the file, if the caller already has one.
+
+        Returns
+        -------
+        tuple or None
+            (entities_path, hash16, size_bytes, modified, stat), or None if
+            the file is a duplicate and should be skipped.
+        """
+        if stat is None:
+            stat = file_path.stat()
+
+        # Check if file should be skipped, getting its hash if not
+        is_duplicate, hash16 = self.dedupe.check_and_get(file_path, stat)
+        if is_duplicate:
+            return None
+
+        # Get file info
+        size_bytes = stat.st_size
+        modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+
+        # Generate output paths
+        entities_path = self.out_dir / f"entities-{hash16}.jsonl"
+
+        return entities_path, hash16, size_bytes, modified, stat
+
+    def _record(
+        self,
+        file_path: Path,
+        job: tuple,
+        summary,
+        scan_started: str,
+        scan_ended: str,
+    ):
+        """Write a scanned file's summary row and mark it as processed.
+
+        Parameters
+        ----------
+        file_path : Path
+            Path of the scanned file.
+        job : tuple
+            Result of ``_prepare`` for the file.
+        summary : FileSummary
+            Scan result for the file.
+        scan_started, scan_ended : str
+            ISO timestamps bracketing the scan.
+        """
+        _, hash16, size_bytes, modified, stat = job
+
+        # Write CSV row; top_types is stored as JSON so readers can parse it
+        self._write_summary_row(
+            [
+                os.fspath(file_path),
+                hash16,
+                size_bytes,
+                modified,
+                summary.controlled,
+                summary.noncontrolled,
+                summary.total,
+                fastjson.dumps(summary.top_types).decode(),
+                scan_started,
+                scan_ended,
+            ]
+        )
+
+        # Mark as processed
+        canonical_key = self.dedupe._canonical_key_from(file_path, stat)
+        self.dedupe.add_processed(file_path, canonical_key)
+
+        # Print counts to stderr
+        print(
+            f"Processed: {file_path.name} - {summary.total} entities ({summary.controlled} controlled, {summary.noncontrolled} noncontrolled)",
+            file=os.sys.stderr,
+        )
+
     def scan_directory(
         self,
         directory: Path,
@@ -244,21 +439,153 @@ class FileScanner:
 
         processed_count = 0
 
-        if recursive:
-            # Recursive scan
-            for file_path in directory.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in self.exts:
-                    if self._scan_one(file_path, chunk_size, overlap):
-                        processed_count += 1
-        else:
-            # Non-recursive scan
-            for file_path in directory.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.exts:
-                    if self._scan_one(file_path, chunk_size, overlap):
+        try:
+            files = self._iter_files(directory, recursive)
+            if self.max_workers > 1:
+                processed_count = self._scan_parallel(files, chunk_size, overlap)
+            else:
+                for file_path, stat in files:
+                    if self._scan_one(file_path, chunk_size, overlap, stat):
                         processed_count += 1
+        finally:
+            # Make this pass's rows visible to readers of the summary
+            self.flush()
+
+        return processed_count
+
+    def _scan_parallel(self, files, chunk_size: int, overlap: int) -> int:
+        """Scan files in the worker pool, recording results in this process.
+
+        Deduplication, the CSV summary and the processed-file journal are only
+        touched here, so workers share no state. At most two files per worker
+        are in flight at a time. If a worker dies, the pool is replaced and the
+        files that were in flight are retried once, one at a time.
+
+        Parameters
+        ----------
+        files : iterable of (Path, os.stat_result)
+            Files to scan, as produced by ``_iter_files``.
+        chunk_size : int
+            Size of text chunks for processing.
+        overlap : int
+            Overlap between chunks.
+
+        Returns
+        -------
+        int
+            Number of files processed.
+        """
+        pending = {}
+        processed_count = 0
+
+        def submit(file_path, job, attempt=0):
+            args = (file_path, self.exts, job[0], chunk_size, overlap, 1)
+            pool = self._get_pool()
+            try:
+                future = pool.submit(_scan_file_worker, *args)
+            except BrokenExecutor:
+                self._discard_pool(pool)
+                pool = self._get_pool()
+                future = pool.submit(_scan_file_worker, *args)
+            return future, (file_path, job, pool, attempt)
+
+        def finish(future, file_path, job, pool, attempt) -> bool:
+            # Record a finished scan; returns True if the file should be retried
+            nonlocal processed_count
+            try:
+                summary, scan_started, scan_ended = future.result()
+                self._record(file_path, job, summary, scan_started, scan_ended)
+                processed_count += 1
+            except BrokenExecutor:
+                # A worker died (e.g. killed for memory), failing every file
+                # in flight with it
+                self._discard_pool(pool)
+                if attempt == 0:
+                    return True
+                print(
+                    f"Error processing {file_path}: worker process died",
+                    file=os.sys.stderr,
+                )
+            except SkippedEncryptedPDF:
+                print(f"Skipped encrypted PDF: {file_path}", file=os.sys.stderr)
+            except Exception as e:  # noqa: BLE001 - one bad file must not end the scan
+                print(f"Error processing {file_path}: {e}", file=os.sys.stderr)
+            return False
+
+        def collect():
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            retry = []
+            for future in done:
+                info = pending.pop(future)
+                if finish(future, *info):
+                    retry.append(info[:2])
+
+            # Retry one at a time, so a file that kills its worker fails alone
+            for file_path, job in retry:
+                try:
+                    future, info = submit(file_path, job, attempt=1)
+                except RuntimeError as e:
+                    print(f"Error processing {file_path}: {e}", file=os.sys.stderr)
+                    continue
+                wait([future])
+                finish(future, *info)
+
+        for file_path, stat in files:
+            try:
+                job = self._prepare(file_path, stat)
+                if job is not None:
+                    future, info = submit(file_path, job)
+                    pending[future] = info
+            except Exception as e:  # noqa: BLE001 - one bad file must not end the scan
+                print(f"Error processing {file_path}: {e}", file=os.sys.stderr)
+                continue
+
+            if len(pending) >= self.max_workers * 2:
+                collect()
+
+        while pending:
+            collect()
 
         return processed_count
 
+    def _iter_files(self, directory: Path, recursive: bool = True):
+        """Yield (path, stat) for each file with a scanned extension.
+
+        Directories are listed with ``os.scandir``, whose entries carry their
+        file type, so only matching files are stat'ed, once each; that stat is
+        passed on to ``_scan_one``. Symlinked directories are not descended
+        into, as with ``Path.rglob``.
+
+        Parameters
+        ----------
+        directory : Path
+            Directory to list.
+        recursive : bool, optional
+            Whether to descend into subdirectories (default: True).
+        """
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError as e:
+                print(f"Error listing {current}: {e}", file=os.sys.stderr)
+                continue
+
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(Path(entry.path))
+                        elif (
+                            os.path.splitext(entry.name)[1].lower() in self.exts
+                            and entry.is_file()
+                        ):
+                            yield Path(entry.path), entry.stat()
+                    except OSError:
+                        continue
+
     def _watch_directory(
         self,
         directory: Path,
@@ -286,6 +613,65 @@ class FileScanner:
                 print(f"Error in watcher: {e}", file=os.sys.stderr)
                 stop_event.wait(poll_seconds)
 
+    def _watch_events(
+        self,
+        directory: Path,
+        poll_seconds: int,
+        stop_event: Event,
+        chunk_size: int = 2000,
+        overlap: int = 100,
+    ):
+        # Watch directory through filesystem events (internal method).
+        # Only changed files are scanned; falls back to polling when the
+        # platform or filesystem cannot deliver events.
+        changes = queue.Queue()
+        exts = {ext.lower() for ext in self.exts}
+        observer = Observer()
+        handler = _ChangeQueueHandler(changes, exts)
+        observer.schedule(handler, str(directory), recursive=True)
+        try:
+            observer.start()
+        except OSError as e:
+            print(
+                f"Warning: file events unavailable ({e}), falling back to polling",
+                file=os.sys.stderr,
+            )
+            self._watch_directory(
+                directory, poll_seconds, stop_event, chunk_size, overlap
+            )
+            return
+
+        print(f"Watching directory: {directory}", file=os.sys.stderr)
+        try:
+            while not stop_event.is_set():
+                try:
+                    file_path = changes.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                # Coalesce the burst of events a single write produces
+                batch = {file_path: None}
+                while True:
+                    try:
+                        batch[changes.get_nowait()] = None
+                    except queue.Empty:
+                        break
+
+                processed = 0
+                for file_path in batch:
+                    if stop_event.is_set():
+                        break
+                    if file_path.is_file() and self._scan_one(
+                        file_path, chunk_size, overlap
+                    ):
+                        processed += 1
+                if processed > 0:
+                    self.flush()
+                    print(f"Processed {processed} files", file=os.sys.stderr)
+        finally:
+            observer.stop()
+            observer.join()
+
     def start_watcher(
         self,
         folder: Path,
@@ -317,16 +703,43 @@ class FileScanner:
                 file=os.sys.stderr,
             )
 
-        # Start watching thread
+        # Start watching thread, on filesystem events when watchdog is installed
         stop_event = Event()
         thread = Thread(
-            target=self._watch_directory,
+            target=self._watch_directory if Observer is None else self._watch_events,
             args=(folder, poll_seconds, stop_event, chunk_size, overlap),
             daemon=True,
         )
         thread.start()
 
-        return WatcherHandle(thread, stop_event)
+        return WatcherHandle(thread, stop_event, self)
+
+
+def _scan_file_worker(
+    file_path: Path,
+    exts: set[str],
+    entities_path: Path,
+    chunk_size: int,
+    overlap: int,
+    workers: int | None = None,
+):
+    """Scan one file, writing its entities; runs in a pool worker or inline.
+
+    Returns
+    -------
+    tuple
+        (summary, scan_started, scan_ended) with ISO timestamps.
+    """
+    scan_started = datetime.now().isoformat()
+    summary = scan_file_once(
+        path=file_path,
+        exts=exts,
+        out_jsonl=entities_path,
+        chunk_size=chunk_size,
+        overlap=overlap,
+        workers=workers,
+    )
+    return summary, scan_started, datetime.now().isoformat()
 
 
 def start_watcher(folder, **kwargs):
@@ -67,6 +67,7 @@ def scan_command(args):
         - exts: Comma-separated file extensions
         - chunk_size: Text chunk size for processing
         - overlap: Overlap between chunks
+        - workers: Worker processes scanning files in parallel
 
     Raises
     ------
@@ -85,9 +86,6 @@ def scan_command(args):
         # Parse extensions
         exts = parse_extensions(args.exts)
 
-        # Create scanner
-        scanner = FileScanner(out_dir, exts)
-
         # Perform scan
         print(f"Scanning directory: {scan_dir}", file=sys.stderr)
         print(f"Output directory: {out_dir}", file=sys.stderr)
@@ -96,9 +94,13 @@ def scan_command(args):
             f"Chunk size: {args.chunk_size}, Overlap: {args.overlap}", file=sys.stderr
         )
 
-        processed = scanner.scan_directory(
-            scan_dir, recursive=True, chunk_size=args.chunk_size, overlap=args.overlap
-        )
+        with FileScanner(out_dir, exts, max_workers=args.workers) as scanner:
+            processed = scanner.scan_directory(
+                scan_dir,
+                recursive=True,
+                chunk_size=args.chunk_size,
+                overlap=args.overlap,
+            )
 
         print(f"Scan complete: {processed} files processed", file=sys.stderr)
 
@@ -229,6 +231,13 @@ Examples:
     scan_parser.add_argument(
         "--overlap", type=int, default=200, help="Chunk overlap size (default: 200)"
     )
+    scan_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes scanning files in parallel (default: memory-aware "
+        "MAX_WORKERS from config.py)",
+    )
     scan_parser.set_defaults(func=scan_command)
 
     # Watch subcommand
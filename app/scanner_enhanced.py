@@ -16,6 +16,7 @@ from typing import Any
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from app import fastjson
 from app.dedupe import DedupeManager
 from app.pipeline import scan_file_once
 from config import (
@@ -202,14 +203,14 @@ class EnhancedScanner:
                         writer = csv.writer(f)
                         writer.writerow(
                             [
-                                str(file_path),
+                                os.fspath(file_path),
                                 hash16,
                                 stat.st_size,
                                 datetime.fromtimestamp(stat.st_mtime).isoformat(),
                                 summary.controlled,
                                 summary.noncontrolled,
                                 summary.total,
-                                str(summary.top_types),
+                                fastjson.dumps(summary.top_types).decode(),
                                 scan_started,
                                 scan_ended,
                             ]
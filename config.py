@@ -25,6 +25,11 @@ MIN_FILE_SIZE = 100  # Skip files smaller than this (bytes)
 MAX_FILE_SIZE = 500 * 1024 * 1024  # Skip files larger than 500MB (safety limit)
 BATCH_SIZE = 100  # Files to process per batch
 
+# Hash behind the per-file hash16 ids (entities-<hash16>.jsonl): "xxh3" uses
+# xxhash, then blake3, then md5 depending on what is installed. Set to "md5"
+# to keep ids compatible with results written by older versions.
+HASH16_ALGORITHM = "xxh3"
+
 # Confidence Thresholds
 MIN_CONFIDENCE = 0.5  # Ignore detections below this confidence
 HIGH_CONFIDENCE = 0.85  # Consider "certain" above this
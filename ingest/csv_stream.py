@@ -25,6 +25,8 @@ class StreamingCSVProcessor:
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.rows_processed = 0
         self.total_rows = None
+        # Bytes of the file consumed so far, updated as row chunks are read
+        self.bytes_read = 0
 
     def estimate_total_rows(self) -> int:
         """Quickly estimate total rows by sampling."""
@@ -91,6 +93,9 @@ class StreamingCSVProcessor:
 
                     # Yield chunk when full
                     if len(chunk) >= chunk_rows:
+                        # Position of the binary buffer under the decoder,
+                        # accurate to its read-ahead
+                        self.bytes_read = f.buffer.tell()
                         yield chunk
                         chunk = []
 
@@ -98,6 +103,7 @@ class StreamingCSVProcessor:
                         self._manage_memory()
 
                 # Yield remaining rows
+                self.bytes_read = f.buffer.tell()
                 if chunk:
                     yield chunk
 
@@ -105,20 +111,31 @@ class StreamingCSVProcessor:
             print(f"Error streaming CSV: {e}")
 
     def stream_concatenated_text(
-        self, chunk_rows: int = 1000, max_chars: int = 10000
-    ) -> Iterator[str]:
+        self, chunk_rows: int = 1000, max_chars: int = 10000, with_sizes: bool = False
+    ) -> Iterator[str] | Iterator[tuple[str, int]]:
         """
         Stream CSV as concatenated text chunks for PII scanning.
 
         Args:
             chunk_rows: Number of rows per chunk
             max_chars: Maximum characters per text chunk
+            with_sizes: Yield ``(text, byte_count)`` pairs, where byte_count is
+                the number of file bytes consumed since the previous chunk
 
         Yields:
             Concatenated text from CSV rows
         """
         text_buffer = []
         current_size = 0
+        bytes_reported = 0
+
+        def emit(text: str):
+            nonlocal bytes_reported
+            if not with_sizes:
+                return text
+            byte_count = self.bytes_read - bytes_reported
+            bytes_reported = self.bytes_read
+            return text, byte_count
 
         for chunk in self.stream_chunks(chunk_rows):
             for row in chunk:
@@ -131,13 +148,13 @@ class StreamingCSVProcessor:
 
                     # Yield when buffer is full
                     if current_size >= max_chars:
-                        yield "\n".join(text_buffer)
+                        yield emit("\n".join(text_buffer))
                         text_buffer = []
                         current_size = 0
 
         # Yield remaining text
         if text_buffer:
-            yield "\n".join(text_buffer)
+            yield emit("\n".join(text_buffer))
 
     def _manage_memory(self):
         """Manage memory usage during processing."""
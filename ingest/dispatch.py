@@ -9,7 +9,7 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from .pdf_stream import iter_pdf_pages
-from .text_stream import iter_text_chunks
+from .text_stream import iter_byte_chunks, iter_text_chunks
 
 
 def iter_file_text(
@@ -17,7 +17,8 @@ def iter_file_text(
     exts: set[str] = {".txt", ".csv", ".log", ".md", ".html", ".pdf"},
     text_chunk_bytes: int = 1_048_576,
     pdf_max_pages: int = 0,
-) -> Iterator[str]:
+    binary: bool = False,
+) -> Iterator[str | bytes]:
     """Route file to appropriate text extraction method based on extension.
 
     This is the main dispatcher that examines file extensions and routes
@@ -33,10 +34,13 @@ def iter_file_text(
         Size of text chunks for text files in bytes (default: 1MB).
     pdf_max_pages : int, optional
         Maximum pages to process for PDFs, 0 means all pages (default: 0).
+    binary : bool, optional
+        Yield text files as raw UTF-8 bytes, leaving decoding to the consumer
+        (default: False). PDF pages are always yielded as str.
 
     Yields
     ------
-    str
+    str or bytes
         Text content extracted from the file in chunks.
 
     Raises
@@ -47,7 +51,7 @@ def iter_file_text(
         If the specified file doesn't exist.
     PermissionError
         If the file can't be read due to permissions.
-        
+
     Examples
     --------
     >>> from pathlib import Path
@@ -66,10 +70,15 @@ def iter_file_text(
         yield from iter_pdf_pages(path, max_pages=pdf_max_pages)
     else:
         # All other extensions are treated as text files
-        yield from iter_text_chunks(path, chunk_bytes=text_chunk_bytes)
+        if binary:
+            yield from iter_byte_chunks(path, chunk_bytes=text_chunk_bytes)
+        else:
+            yield from iter_text_chunks(path, chunk_bytes=text_chunk_bytes)
 
 
-def extract_text_stream(path: Path, chunk_size: int = 10000) -> Iterator[str]:
+def extract_text_stream(
+    path: Path, chunk_size: int = 10000, binary: bool = False
+) -> Iterator[str | bytes]:
     """Simple streaming text extraction for any file type.
 
     Provides a resilient text extraction interface with automatic fallback
@@ -81,12 +90,15 @@ def extract_text_stream(path: Path, chunk_size: int = 10000) -> Iterator[str]:
         Path to file to extract text from.
     chunk_size : int, optional
         Size of text chunks in characters (default: 10000).
+    binary : bool, optional
+        Yield text files as raw UTF-8 bytes instead of decoded str, so the
+        consumer can decode where it suits it (default: False).
 
     Yields
     ------
-    str
+    str or bytes
         Text chunks extracted from the file.
-        
+
     Notes
     -----
     This function includes fallback mechanisms:
@@ -96,12 +108,17 @@ def extract_text_stream(path: Path, chunk_size: int = 10000) -> Iterator[str]:
     """
     try:
         # Use the existing dispatch function
-        for text_chunk in iter_file_text(path, text_chunk_bytes=chunk_size):
+        for text_chunk in iter_file_text(
+            path, text_chunk_bytes=chunk_size, binary=binary
+        ):
             yield text_chunk
     except Exception as e:
         print(f"Warning: Could not extract text from {path}: {e}")
         # Fallback: try reading as plain text
         try:
+            if binary:
+                yield from iter_byte_chunks(path, chunk_bytes=chunk_size)
+                return
             with open(path, encoding="utf-8", errors="ignore") as f:
                 while True:
                     chunk = f.read(chunk_size)
@@ -2,14 +2,57 @@
 Text streaming functionality for binary file reading.
 """
 
+import mmap
 from collections.abc import Iterator
 from pathlib import Path
 
+# How far past a chunk boundary to look for a newline to end the chunk on
+LINE_ALIGN_WINDOW = 64 * 1024
+
+
+def _chunk_end(mm: mmap.mmap, position: int, chunk_bytes: int) -> int:
+    """
+    Find where the chunk starting at position should end.
+
+    Chunks end just after a newline when one is found within
+    LINE_ALIGN_WINDOW of the nominal boundary, so entities are never split
+    across chunks. Otherwise the boundary is moved back off any UTF-8
+    continuation bytes so multi-byte characters stay whole.
+    """
+    end = position + chunk_bytes
+    file_len = len(mm)
+    if end >= file_len:
+        return file_len
+
+    newline = mm.find(b"\n", end, end + LINE_ALIGN_WINDOW)
+    if newline != -1:
+        return newline + 1
+
+    back = end
+    while back > position and back > end - 3 and mm[back] & 0xC0 == 0x80:
+        back -= 1
+    return back if back > position else end
+
+
+def _iter_mapped_ranges(mm: mmap.mmap, chunk_bytes: int) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of line-aligned chunks of a mapped file."""
+    if hasattr(mm, "madvise"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+    position = 0
+    while position < len(mm):
+        end = _chunk_end(mm, position, chunk_bytes)
+        yield position, end
+        position = end
+
 
 def iter_text_chunks(path: Path, chunk_bytes: int = 1_048_576) -> Iterator[str]:
     """
     Stream text chunks from a binary file with UTF-8 decoding.
 
+    Regular files are memory-mapped and decoded straight from the mapping,
+    with chunks ending on line boundaries where possible.
+
     Args:
         path: Path to the text file
         chunk_bytes: Size of each chunk in bytes (default: 1MB)
@@ -22,12 +65,72 @@ def iter_text_chunks(path: Path, chunk_bytes: int = 1_048_576) -> Iterator[str]:
         PermissionError: If the file can't be read
     """
     with open(path, "rb") as file:
-        while True:
-            chunk = file.read(chunk_bytes)
-            if not chunk:
-                break
-
-            # Decode UTF-8 with error handling
-            text = chunk.decode("utf-8", errors="ignore")
-            if text.strip():  # Only yield non-empty chunks
-                yield text
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file
+        except OSError:
+            mm = None  # Not mappable (pipe, special file): read it instead
+
+        if mm is None:
+            while True:
+                chunk = file.read(chunk_bytes)
+                if not chunk:
+                    break
+
+                # Decode UTF-8 with error handling
+                text = chunk.decode("utf-8", errors="ignore")
+                if text and not text.isspace():  # Only yield non-empty chunks
+                    yield text
+            return
+
+        with mm, memoryview(mm) as view:
+            for start, end in _iter_mapped_ranges(mm, chunk_bytes):
+                # Decode from the mapping without an intermediate bytes copy
+                text = str(view[start:end], "utf-8", errors="ignore")
+                if text and not text.isspace():  # Only yield non-empty chunks
+                    yield text
+
+
+def iter_byte_chunks(path: Path, chunk_bytes: int = 1_048_576) -> Iterator[bytes]:
+    """
+    Stream raw chunks from a text file without decoding them.
+
+    Useful when chunks are handed to worker processes, which can decode
+    them in parallel instead of the reading process doing it up front.
+    Chunks end on line boundaries where possible, like iter_text_chunks.
+
+    Args:
+        path: Path to the text file
+        chunk_bytes: Size of each chunk in bytes (default: 1MB)
+
+    Yields:
+        Raw UTF-8 byte chunks
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        PermissionError: If the file can't be read
+    """
+    with open(path, "rb") as file:
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file
+        except OSError:
+            mm = None  # Not mappable (pipe, special file): read it instead
+
+        if mm is None:
+            while True:
+                chunk = file.read(chunk_bytes)
+                if not chunk:
+                    break
+
+                if chunk and not chunk.isspace():  # Only yield non-empty chunks
+                    yield chunk
+            return
+
+        with mm:
+            for start, end in _iter_mapped_ranges(mm, chunk_bytes):
+                chunk = mm[start:end]
+                if chunk and not chunk.isspace():  # Only yield non-empty chunks
+                    yield chunk
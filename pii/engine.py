@@ -7,6 +7,7 @@ filtering to reduce false positives.
 
 import re
 import sys
+import threading
 from pathlib import Path
 
 from presidio_analyzer import (
@@ -24,6 +25,10 @@ from .schema import EntityHit
 sys.path.append(str(Path(__file__).parent.parent))
 from config import FEATURES
 
+# Every supported entity needs a digit, an "@" or a social profile URL, so text
+# without any of them cannot produce a hit and is skipped before analysis
+_CANDIDATE_RE = re.compile(r"[\d@]|linkedin\.com/|facebook\.com/", re.IGNORECASE)
+
 
 class EnhancedRobustRecognizer(PatternRecognizer):
     """Enhanced pattern recognizer with overlapping result filtering.
@@ -264,6 +269,34 @@ def build_analyzer() -> AnalyzerEngine | None:
         return None
 
 
+_analyzer: AnalyzerEngine | None = None
+_analyzer_built = False
+_analyzer_lock = threading.Lock()
+
+
+def get_analyzer() -> AnalyzerEngine | None:
+    """Return the process-wide analyzer, building it on first use.
+
+    Building the analyzer loads the spaCy model and registers every
+    recognizer, so it is done once per process rather than per call. Worker
+    threads starting together share a single build.
+
+    Returns
+    -------
+    AnalyzerEngine or None
+        Shared analyzer, or None if Presidio could not be initialised.
+    """
+    global _analyzer, _analyzer_built
+
+    if not _analyzer_built:
+        with _analyzer_lock:
+            if not _analyzer_built:
+                _analyzer = build_analyzer()
+                _analyzer_built = True
+
+    return _analyzer
+
+
 def _chunk(text: str, size: int = 2000, overlap: int = 100) -> list[str]:
     """Split text into overlapping chunks for processing.
 
@@ -339,8 +372,12 @@ def hits_from_text(
     - Deduplication of overlapping detections
     - Context extraction around each entity
     - Classification into Controlled/NonControlled categories
+    - Skipping text that contains no candidate characters at all
     """
-    analyzer = build_analyzer()
+    if not _CANDIDATE_RE.search(text):
+        return []
+
+    analyzer = get_analyzer()
 
     if analyzer:
         return _process_with_presidio(analyzer, text, chunk_size, overlap)
@@ -366,6 +403,9 @@ def _process_with_presidio(
             pass
 
     for i, chunk in enumerate(chunks):
+        if not _CANDIDATE_RE.search(chunk):
+            continue
+
         try:
             results = analyzer.analyze(
                 text=chunk,
@@ -443,39 +483,36 @@ def _process_with_presidio(
 
 def _process_with_fallback(text: str, chunk_size: int, overlap: int) -> list[EntityHit]:
     """Process text using fallback regex patterns."""
-    from .recognizers import FALLBACK_REGEX
+    from .recognizers import fallback_patterns_for
 
     all_hits = []
 
-    for entity_type, patterns in FALLBACK_REGEX.items():
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-
-            for match in matches:
-                entity_text = match.group(0)
+    for entity_type, pattern in fallback_patterns_for(text):
+        for match in pattern.finditer(text):
+            entity_text = match.group(0)
 
-                # Get context
-                context_start = max(0, match.start() - 30)
-                context_end = min(len(text), match.end() + 30)
-                context_left = text[context_start : match.start()].strip()
-                context_right = text[match.end() : context_end].strip()
+            # Get context
+            context_start = max(0, match.start() - 30)
+            context_end = min(len(text), match.end() + 30)
+            context_left = text[context_start : match.start()].strip()
+            context_right = text[match.end() : context_end].strip()
 
-                # Classify the entity
-                label = classify_label(
-                    entity_type, entity_text, text, match.start(), match.end()
-                )
+            # Classify the entity
+            label = classify_label(
+                entity_type, entity_text, text, match.start(), match.end()
+            )
 
-                hit = EntityHit(
-                    entity_type=entity_type,
-                    value=entity_text,
-                    start=match.start(),
-                    end=match.end(),
-                    score=0.7,  # Default confidence for regex
-                    label=label,
-                    context_left=context_left,
-                    context_right=context_right,
-                )
+            hit = EntityHit(
+                entity_type=entity_type,
+                value=entity_text,
+                start=match.start(),
+                end=match.end(),
+                score=0.7,  # Default confidence for regex
+                label=label,
+                context_left=context_left,
+                context_right=context_right,
+            )
 
-                all_hits.append(hit)
+            all_hits.append(hit)
 
     return all_hits
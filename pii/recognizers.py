@@ -3,8 +3,15 @@ Custom PII recognizers for Presidio and fallback regex patterns.
 """
 
 import re
+import threading
+
 from presidio_analyzer import Pattern, PatternRecognizer
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # Fallback regex patterns for when Presidio is not available
 FALLBACK_REGEX = {
     "ID": [
@@ -63,6 +70,99 @@ FALLBACK_REGEX = {
     ],
 }
 
+# (entity_type, compiled pattern) for every fallback regex, in declaration order
+FALLBACK_PATTERNS = [
+    (entity_type, re.compile(pattern, re.IGNORECASE))
+    for entity_type, patterns in FALLBACK_REGEX.items()
+    for pattern in patterns
+]
+
+# Hyperscan database over all fallback patterns; None until built, False if
+# hyperscan is unavailable or rejects a pattern
+_fallback_db = None
+
+# Per-thread hyperscan scratch space; a scratch can't be shared by concurrent
+# scans, so each thread allocates one once and reuses it
+_fallback_scratch = threading.local()
+
+
+def _get_fallback_db():
+    """Compile every fallback pattern into one hyperscan block-mode database."""
+    global _fallback_db
+
+    if _fallback_db is None:
+        _fallback_db = False
+        if hyperscan is not None:
+            flags = (
+                hyperscan.HS_FLAG_CASELESS
+                | hyperscan.HS_FLAG_SINGLEMATCH
+                | hyperscan.HS_FLAG_UTF8
+                | hyperscan.HS_FLAG_UCP
+            )
+            try:
+                db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                db.compile(
+                    expressions=[p.pattern.encode() for _, p in FALLBACK_PATTERNS],
+                    ids=list(range(len(FALLBACK_PATTERNS))),
+                    flags=[flags] * len(FALLBACK_PATTERNS),
+                )
+                _fallback_db = db
+            except Exception as e:  # noqa: BLE001 - any failure falls back to re
+                print(f"Warning: Could not compile hyperscan patterns: {e}")
+
+    return _fallback_db
+
+
+def _get_fallback_scratch(db):
+    """Return the calling thread's scratch space for db, allocating it once."""
+    scratch = getattr(_fallback_scratch, "space", None)
+    if scratch is None:
+        scratch = _fallback_scratch.space = hyperscan.Scratch(db)
+    return scratch
+
+
+def prepare_fallback_matcher() -> None:
+    """
+    Compile the fallback database and allocate the calling thread's scratch.
+
+    Called from worker process initializers so the first chunk a worker
+    scans doesn't pay for either.
+    """
+    db = _get_fallback_db()
+    if db:
+        _get_fallback_scratch(db)
+
+
+def fallback_patterns_for(text: str) -> list[tuple[str, re.Pattern]]:
+    """
+    Select the fallback patterns that can match text.
+
+    With hyperscan installed all patterns are tested in a single pass over
+    the text and only those that hit are returned, so the full regex scan
+    runs for just those patterns. Without it every pattern is returned.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        (entity_type, compiled pattern) pairs in declaration order
+    """
+    db = _get_fallback_db()
+    if not db:
+        return FALLBACK_PATTERNS
+
+    matched = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        matched.add(pattern_id)
+
+    db.scan(
+        text.encode("utf-8", "surrogatepass"),
+        match_event_handler=on_match,
+        scratch=_get_fallback_scratch(db),
+    )
+    return [FALLBACK_PATTERNS[i] for i in sorted(matched)]
+
 
 class CustomIDRecognizer(PatternRecognizer):
     """Custom recognizer for ID numbers."""
@@ -179,18 +279,16 @@ def apply_fallback_regex(text: str) -> list[dict]:
     """
     results = []
 
-    for entity_type, patterns in FALLBACK_REGEX.items():
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                results.append(
-                    {
-                        "entity_type": entity_type,
-                        "value": match.group(),
-                        "start": match.start(),
-                        "end": match.end(),
-                        "score": 0.8,  # Default confidence score
-                    }
-                )
+    for entity_type, pattern in fallback_patterns_for(text):
+        for match in pattern.finditer(text):
+            results.append(
+                {
+                    "entity_type": entity_type,
+                    "value": match.group(),
+                    "start": match.start(),
+                    "end": match.end(),
+                    "score": 0.8,  # Default confidence score
+                }
+            )
 
     return results
@@ -0,0 +1,99 @@
+"""
+Tests for Config: deferred saving, reset and copies of preference lists.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app import config
+from app.config import Config, get_config, reset_config
+from app.constants import CONFIG_FILENAME
+
+
+class _ExitHooks:
+    """Stand-in for the atexit module that records registered callables."""
+
+    def __init__(self):
+        self.hooks = []
+        self.registered = 0
+
+    def register(self, func):
+        self.registered += 1
+        self.hooks.append(func)
+        return func
+
+    def unregister(self, func):
+        self.hooks = [hook for hook in self.hooks if hook != func]
+
+
+@pytest.fixture
+def exit_hooks(tmp_path, monkeypatch):
+    """Point the home directory at tmp_path and capture exit hooks."""
+    hooks = _ExitHooks()
+    monkeypatch.setattr(config, "atexit", hooks)
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+    get_config.cache_clear()
+    yield hooks
+    get_config.cache_clear()
+
+
+def test_setters_mark_dirty_and_flush_writes(tmp_path, exit_hooks):
+    """Setters only mark the preferences; flush writes them once."""
+    config_file = tmp_path / "config.json"
+    cfg = Config.load(config_file)
+    assert exit_hooks.hooks == [cfg.flush]
+    assert not cfg.prefs.dirty
+
+    cfg.set_default_output_dir("/scans")
+    cfg.set_default_chunk_settings(8000, 100)
+    assert cfg.prefs.dirty
+    assert not config_file.exists()
+
+    cfg.flush()
+    assert not cfg.prefs.dirty
+    saved = json.loads(config_file.read_text())
+    assert saved["default_output_dir"] == "/scans"
+    assert saved["default_chunk_size"] == 8000
+    assert saved["default_overlap"] == 100
+
+    # Nothing pending, so a second flush leaves the file alone
+    config_file.unlink()
+    cfg.flush()
+    assert not config_file.exists()
+
+
+def test_reset_config_drops_pending_changes(tmp_path, exit_hooks):
+    """Reset removes the file and the exit hook, and loads nothing new."""
+    (tmp_path / CONFIG_FILENAME).write_text(json.dumps({"default_poll_seconds": 9}))
+    cfg = get_config()
+    cfg.set_default_poll_seconds(30)
+
+    reset_config()
+    assert exit_hooks.hooks == []
+    assert not (tmp_path / CONFIG_FILENAME).exists()
+
+    # Resetting before any config is loaded does not load one
+    reset_config()
+    assert exit_hooks.registered == 1
+    assert exit_hooks.hooks == []
+
+    fresh = get_config()
+    assert fresh is not cfg
+    assert fresh.get_default_poll_seconds() == config.DEFAULT_POLL_SECONDS
+    assert exit_hooks.hooks == [fresh.flush]
+
+
+def test_list_getters_return_copies(tmp_path, exit_hooks):
+    """Mutating a returned list does not change the stored preferences."""
+    cfg = Config.load(tmp_path / "config.json")
+    cfg.add_recent_output_dir("/scans/a")
+
+    recent = cfg.get_recent_output_dirs()
+    recent.append("/scans/b")
+    extensions = cfg.get_default_extensions()
+    extensions.clear()
+
+    assert cfg.get_recent_output_dirs() == ["/scans/a"]
+    assert cfg.get_default_extensions() == list(config.DEFAULT_EXTENSIONS)
@@ -0,0 +1,191 @@
+"""
+Tests for the DedupeManager journal: persistence, recovery and migration.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+
+from app import dedupe
+from app.dedupe import JOURNAL_MAGIC, RECORD, DedupeManager
+
+
+def _make_files(root: Path, count: int) -> list[Path]:
+    """Create count small files with distinct contents."""
+    root.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        path = root / f"file{i}.txt"
+        path.write_text(f"contents {i}\n")
+        files.append(path)
+    return files
+
+
+def _record(manager: DedupeManager, path: Path):
+    """Mark a file processed the way FileScanner does."""
+    manager.add_processed(path, manager._canonical_key_from(path, os.stat(path)))
+
+
+def test_journal_round_trip(tmp_path):
+    """Processed files survive a reload; changed files are scanned again."""
+    out_dir = tmp_path / "out"
+    files = _make_files(tmp_path / "src", 5)
+
+    manager = DedupeManager(out_dir)
+    for path in files[:3]:
+        _record(manager, path)
+    manager.close()
+
+    journal = out_dir / ".seen.log"
+    assert journal.read_bytes()[: len(JOURNAL_MAGIC)] == JOURNAL_MAGIC
+    assert journal.stat().st_size == len(JOURNAL_MAGIC) + 3 * RECORD.size
+
+    reloaded = DedupeManager(out_dir)
+    assert reloaded.processed == manager.processed
+    assert all(reloaded.is_duplicate(path) for path in files[:3])
+    assert not any(reloaded.is_duplicate(path) for path in files[3:])
+
+    # A modified file no longer matches its recorded signature
+    files[0].write_text("changed contents\n")
+    assert not reloaded.is_duplicate(files[0])
+    reloaded.close()
+
+
+def test_renamed_file_is_still_duplicate(tmp_path):
+    """Identity is (st_dev, st_ino), so a rename is not a new file."""
+    out_dir = tmp_path / "out"
+    (path,) = _make_files(tmp_path / "src", 1)
+
+    manager = DedupeManager(out_dir)
+    _record(manager, path)
+    manager.close()
+
+    renamed = path.with_name("renamed.txt")
+    path.rename(renamed)
+    reloaded = DedupeManager(out_dir)
+    assert reloaded.is_duplicate(renamed)
+    reloaded.close()
+
+
+def test_torn_trailing_record_is_dropped(tmp_path):
+    """A partial record from an interrupted write is ignored and truncated."""
+    out_dir = tmp_path / "out"
+    files = _make_files(tmp_path / "src", 2)
+
+    manager = DedupeManager(out_dir)
+    for path in files:
+        _record(manager, path)
+    manager.close()
+
+    journal = out_dir / ".seen.log"
+    intact_size = journal.stat().st_size
+    with open(journal, "ab") as f:
+        f.write(b"\xff" * (RECORD.size // 2))
+
+    reloaded = DedupeManager(out_dir)
+    assert journal.stat().st_size == intact_size
+    assert len(reloaded.processed) == 2
+    assert all(reloaded.is_duplicate(path) for path in files)
+
+    # Appends after recovery line up with whole records again
+    (new_file,) = _make_files(tmp_path / "more", 1)
+    _record(reloaded, new_file)
+    reloaded.close()
+    assert journal.stat().st_size == intact_size + RECORD.size
+    assert DedupeManager(out_dir).is_duplicate(new_file)
+
+
+def test_unrecognized_journal_is_discarded(tmp_path):
+    """A journal without the magic header is not trusted."""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    journal = out_dir / ".seen.log"
+    journal.write_bytes(b"NOTAJRNL" + b"\x00" * RECORD.size)
+
+    manager = DedupeManager(out_dir)
+    assert manager.processed == {}
+    assert not journal.exists()
+    manager.close()
+
+
+def test_legacy_index_is_imported(tmp_path):
+    """Unchanged files from a legacy .summary_index.json are carried over."""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    unchanged, changed, deleted = _make_files(tmp_path / "src", 3)
+
+    def legacy_key(path: Path) -> str:
+        st = path.stat()
+        return f"{path.resolve()}|{st.st_size}|{st.st_mtime_ns}"
+
+    index = {legacy_key(path): True for path in (unchanged, changed, deleted)}
+    (out_dir / ".summary_index.json").write_text(json.dumps(index))
+    changed.write_text("edited since the legacy scan\n")
+    deleted.unlink()
+
+    manager = DedupeManager(out_dir)
+    assert manager.is_duplicate(unchanged)
+    assert not manager.is_duplicate(changed)
+    assert len(manager.processed) == 1
+    manager.close()
+
+    # The import is written to the journal, so it survives without the index
+    (out_dir / ".summary_index.json").unlink()
+    reloaded = DedupeManager(out_dir)
+    assert reloaded.is_duplicate(unchanged)
+    reloaded.close()
+
+
+def test_journal_compaction(tmp_path, monkeypatch):
+    """A journal of mostly stale records is rewritten with one per file."""
+    monkeypatch.setattr(dedupe, "JOURNAL_COMPACT_BYTES", 64 * RECORD.size)
+    out_dir = tmp_path / "out"
+    files = _make_files(tmp_path / "src", 2)
+
+    manager = DedupeManager(out_dir)
+    journal = out_dir / ".seen.log"
+    for i in range(200):
+        os.utime(files[0], ns=(i * 1_000_000_000, i * 1_000_000_000))
+        _record(manager, files[0])
+    _record(manager, files[1])
+    assert journal.stat().st_size < len(JOURNAL_MAGIC) + 200 * RECORD.size
+    manager.close()
+
+    reloaded = DedupeManager(out_dir)
+    assert reloaded.processed == manager.processed
+    assert all(reloaded.is_duplicate(path) for path in files)
+    reloaded.close()
+
+
+def test_lookup_only_manager_holds_no_journal(tmp_path):
+    """Managers that never record a file leave the journal closed."""
+    (path,) = _make_files(tmp_path / "src", 1)
+
+    manager = DedupeManager(tmp_path / "out")
+    assert not manager.is_duplicate(path)
+    assert manager._fd == -1
+    manager.close()
+
+
+def test_path_hash_journal_is_converted(tmp_path):
+    """Journals whose records carried a path hash load and are rewritten."""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (path,) = _make_files(tmp_path / "src", 1)
+    st = os.stat(path)
+    old_record = struct.Struct("<QQQqQ")
+    (out_dir / ".seen.log").write_bytes(
+        b"GGSEEN\x00\x04"
+        + old_record.pack(st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, 1234)
+    )
+    (out_dir / ".seen.bloom").write_bytes(b"stale filter")
+
+    manager = DedupeManager(out_dir)
+    assert manager.is_duplicate(path)
+    assert not (out_dir / ".seen.bloom").exists()
+    journal = (out_dir / ".seen.log").read_bytes()
+    assert journal == JOURNAL_MAGIC + RECORD.pack(
+        st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+    )
+    manager.close()
@@ -0,0 +1,31 @@
+"""
+Tests for scan_file_once with concurrent block scanning.
+"""
+
+from app.pipeline import scan_file_once
+
+
+def test_workers_match_sequential_scan(tmp_path):
+    """Scanning blocks on several threads gives the sequential results."""
+    path = tmp_path / "people.txt"
+    path.write_text(
+        "".join(
+            f"Contact user{i}@example.com or call 555-01{i % 100:02d}, "
+            f"SSN 123-45-{i:04d}\n"
+            for i in range(300)
+        ),
+        encoding="utf-8",
+    )
+
+    results = {}
+    for workers in (1, 4):
+        out_jsonl = tmp_path / f"entities-{workers}.jsonl"
+        summary = scan_file_once(
+            path, text_chunk_bytes=512, out_jsonl=out_jsonl, workers=workers
+        )
+        results[workers] = (summary, out_jsonl.read_bytes())
+
+    sequential, parallel = results[1], results[4]
+    assert sequential[0].total > 0
+    assert parallel[0] == sequential[0]
+    assert parallel[1] == sequential[1]
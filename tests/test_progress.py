@@ -0,0 +1,67 @@
+"""
+Tests for ProgressTracker's per-thread counter rows.
+"""
+
+import threading
+
+from app.progress import ProgressTracker
+
+
+def _update_from_threads(tracker: ProgressTracker, threads: int, updates: int):
+    """Call tracker.update() from several threads at once."""
+    barrier = threading.Barrier(threads)
+
+    def work():
+        barrier.wait()
+        for _ in range(updates):
+            tracker.update(entities=3, controlled=1, noncontrolled=2, bytes_count=10)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def test_thread_rows_sum_to_totals():
+    """Each thread counts in its own row and readers see the sum."""
+    tracker = ProgressTracker("threads")
+    _update_from_threads(tracker, threads=4, updates=1000)
+
+    # The base row plus one row per updating thread
+    assert len(tracker._rows) == 5
+    assert tracker.processed_items == 4000
+    stats = tracker.get_stats()
+    assert stats["entities_found"] == 12000
+    assert stats["controlled_entities"] == 4000
+    assert stats["noncontrolled_entities"] == 8000
+    assert stats["bytes_processed"] == 40000
+
+
+def test_assignment_adjusts_the_total():
+    """Assigning a counter sets the summed value, not one row."""
+    tracker = ProgressTracker("assign")
+    _update_from_threads(tracker, threads=2, updates=10)
+
+    tracker.processed_items = 5
+    assert tracker.processed_items == 5
+    tracker.update(processed=2)
+    assert tracker.processed_items == 7
+
+
+def test_reset_counters_zeroes_every_row():
+    """reset_counters clears all rows, and later updates count from zero."""
+    tracker = ProgressTracker("reset")
+    tracker.files_processed = 3
+    _update_from_threads(tracker, threads=3, updates=50)
+
+    tracker.reset_counters()
+    assert all(not any(row) for row in tracker._rows)
+    stats = tracker.get_stats()
+    assert stats["processed_items"] == 0
+    assert stats["entities_found"] == 0
+    assert stats["files_processed"] == 0
+
+    tracker.update(entities=4)
+    assert tracker.processed_items == 1
+    assert tracker.entities_found == 4
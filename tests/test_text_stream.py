@@ -0,0 +1,53 @@
+"""
+Tests for chunk boundaries in the memory-mapped text reader.
+"""
+
+import mmap
+
+from ingest import text_stream
+from ingest.text_stream import _chunk_end, iter_text_chunks
+
+
+def _map(path):
+    """Memory-map a file read-only."""
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def test_chunk_ends_after_next_newline(tmp_path):
+    """A boundary inside a line moves to just after that line's newline."""
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"alice@example.com\nbob@example.com\n")
+
+    with _map(path) as mm:
+        assert _chunk_end(mm, 0, 5) == len(b"alice@example.com\n")
+        assert _chunk_end(mm, 0, 1000) == len(mm)
+
+
+def test_chunk_end_keeps_utf8_characters_whole(tmp_path, monkeypatch):
+    """Without a nearby newline the boundary backs off continuation bytes."""
+    monkeypatch.setattr(text_stream, "LINE_ALIGN_WINDOW", 8)
+    path = tmp_path / "accents.txt"
+    path.write_bytes("é€".encode() * 20)
+
+    with _map(path) as mm:
+        # Chunks shorter than one character must split it to make progress
+        for chunk_bytes in range(4, 20):
+            end = _chunk_end(mm, 0, chunk_bytes)
+            assert 0 < end <= chunk_bytes
+            mm[:end].decode("utf-8")
+
+
+def test_text_chunks_reassemble_the_file(tmp_path, monkeypatch):
+    """Chunks split on lines or characters and join back to the original."""
+    monkeypatch.setattr(text_stream, "LINE_ALIGN_WINDOW", 16)
+    text = "".join(f"user{i}@example.com ünïcödé €{i}\n" for i in range(50))
+    text += "ñ" * 200
+    path = tmp_path / "mixed.txt"
+    path.write_text(text, encoding="utf-8")
+
+    chunks = list(iter_text_chunks(path, chunk_bytes=64))
+    assert len(chunks) > 1
+    assert "".join(chunks) == text
+    # Lines are never split; only the final newline-free run is cut mid-line
+    assert all(chunk.endswith("\n") or set(chunk) == {"ñ"} for chunk in chunks)